@@ -117,7 +117,7 @@ class EventHandler:
         Returns:
             True if application should continue running, False if quit requested
         """
-        for event in events:
+        for i, event in enumerate(events):
             if event.type == pygame.QUIT:
                 return False
 
@@ -144,27 +144,37 @@ class EventHandler:
                     result = tool.handle_key_up(event.key, self.tool_context)
                     self._process_tool_result(result)
 
+            # Motion only changes hover state in buttons and pickers, so of a
+            # run of motion events they only see the last one (the active tool
+            # still gets every motion event, e.g. for paint strokes)
+            ui_event = not (
+                event.type == pygame.MOUSEMOTION
+                and i + 1 < len(events)
+                and events[i + 1].type == pygame.MOUSEMOTION
+            )
+
             # Handle button events
             button_handled = False
-            for button in self.buttons:
-                if button.handle_event(event):
-                    button_handled = True
-                    break  # Stop after first button handles it
+            if ui_event:
+                for button in self.buttons:
+                    if button.handle_event(event):
+                        button_handled = True
+                        break  # Stop after first button handles it
 
             # Handle picker/browser events (depends on active tool)
             picker_handled = False
-            active_tool = self.tool_manager.get_active_tool_name()
-            if active_tool == "stamp":
-                # Stamp browser is active
-                picker_handled = self.stamp_browser.handle_event(event)
-            elif self.state.mode == "greens":
-                picker_handled = self.greens_picker.handle_event(event)
-            else:
-                picker_handled = self.terrain_picker.handle_event(event)
+            if ui_event:
+                active_tool = self.tool_manager.get_active_tool_name()
+                if active_tool == "stamp":
+                    # Stamp browser is active
+                    picker_handled = self.stamp_browser.handle_event(event)
+                elif self.state.mode == "greens":
+                    picker_handled = self.greens_picker.handle_event(event)
+                else:
+                    picker_handled = self.terrain_picker.handle_event(event)
 
             # Handle tool picker events
-            tool_picker_handled = self.tool_picker.handle_event(event)
-            if tool_picker_handled:
+            if ui_event and self.tool_picker.handle_event(event):
                 continue
 
             # Handle canvas events (only if button/picker didn't handle)
@@ -8,7 +8,7 @@ tileset backgrounds and sprites. Uses shared tile decoding from golf.core.
 import json
 
 import pygame
-from pygame import Surface
+from pygame import Rect, Surface
 
 from golf.core.chr_tile import BYTES_PER_TILE, TILE_SIZE, decode_tile
 from golf.core.palettes import GREENS_PALETTE, PALETTES
@@ -19,6 +19,17 @@ from .constants import (
 )
 
 
+def display_format(surf: Surface, alpha: bool = False) -> Surface:
+    """
+    Convert a surface to the display's pixel format so blits skip per-pixel conversion.
+
+    Returns the surface unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
 _placeholder_cache: dict[int, Surface] = {}
 
 def render_placeholder_tile(size: int) -> Surface:
@@ -42,6 +53,27 @@ def render_placeholder_tile(size: int) -> Surface:
     return surf
 
 
+# Tile atlas layout: slots 0x00-0xFF hold background tiles, slot 0x100 the placeholder
+ATLAS_SLOTS = 0x101
+ATLAS_COLUMNS = 16
+
+
+_atlas_areas_cache: dict[int, list[Rect]] = {}
+
+def atlas_areas(scale: int) -> list[Rect]:
+    """Source rects of each atlas slot, indexed by tile value."""
+    if scale in _atlas_areas_cache:
+        return _atlas_areas_cache[scale]
+
+    tile_px = TILE_SIZE * scale
+    areas = [
+        Rect((slot % ATLAS_COLUMNS) * tile_px, (slot // ATLAS_COLUMNS) * tile_px, tile_px, tile_px)
+        for slot in range(ATLAS_SLOTS)
+    ]
+    _atlas_areas_cache[scale] = areas
+    return areas
+
+
 class Tileset:
     """Loads and renders NES CHR tile data using pygame."""
 
@@ -51,6 +83,7 @@ class Tileset:
 
         self.num_tiles = len(self.data) // BYTES_PER_TILE
         self._cache: dict[tuple[int, int, int], Surface] = {}
+        self._atlases: dict[tuple[int, int], Surface] = {}
 
     def decode_tile(self, tile_idx: int) -> list[list[int]]:
         """
@@ -63,8 +96,9 @@ class Tileset:
     def render_tile(self, tile_idx: int, palette_idx: int, scale: int = 1) -> Surface:
         """Render a tile to a Pygame surface with given palette."""
         cache_key = (tile_idx, palette_idx, scale)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         palette = PALETTES[palette_idx] if palette_idx < len(PALETTES) else PALETTES[1]
         pixels = self.decode_tile(tile_idx)
@@ -85,8 +119,9 @@ class Tileset:
     def render_tile_greens(self, tile_idx: int, scale: int = 1) -> Surface:
         """Render a tile using the greens palette."""
         cache_key = (tile_idx, GREENS_PALETTE_NUM, scale)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         if tile_idx == 0x100:
             surf = render_placeholder_tile(TILE_SIZE * scale)
@@ -107,6 +142,46 @@ class Tileset:
         return surf
 
 
+    def get_atlas(self, palette_idx: int, scale: int = 1) -> Surface:
+        """
+        Get every tile rendered with the given palette into one Surface.
+
+        Slot layout matches atlas_areas(); slot 0x100 holds the placeholder tile.
+        """
+        cache_key = (palette_idx, scale)
+        atlas = self._atlases.get(cache_key)
+        if atlas is None:
+            atlas = self._build_atlas(
+                lambda tile_idx: self.render_tile(tile_idx, palette_idx, scale), scale
+            )
+            self._atlases[cache_key] = atlas
+        return atlas
+
+    def get_atlas_greens(self, scale: int = 1) -> Surface:
+        """Get every tile rendered with the greens palette into one Surface."""
+        cache_key = (GREENS_PALETTE_NUM, scale)
+        atlas = self._atlases.get(cache_key)
+        if atlas is None:
+            atlas = self._build_atlas(
+                lambda tile_idx: self.render_tile_greens(tile_idx, scale), scale
+            )
+            self._atlases[cache_key] = atlas
+        return atlas
+
+    def _build_atlas(self, render, scale: int) -> Surface:
+        """Blit tiles 0x00-0xFF and the placeholder into a new atlas Surface."""
+        tile_px = TILE_SIZE * scale
+        rows = (ATLAS_SLOTS + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+        atlas = Surface((ATLAS_COLUMNS * tile_px, rows * tile_px))
+
+        areas = atlas_areas(scale)
+        for tile_idx in range(0x100):
+            atlas.blit(render(tile_idx), areas[tile_idx])
+        atlas.blit(render_placeholder_tile(tile_px), areas[0x100])
+
+        return atlas.convert()
+
+
 class Sprite:
     """Loads and renders a sprite from JSON file with embedded CHR data."""
 
@@ -19,6 +19,8 @@ from editor.core.constants import (
 
 from .base_tool import ToolResult
 
+_SHIFT_KEYS = frozenset((pygame.K_LSHIFT, pygame.K_RSHIFT))
+
 
 class TransformToolState:
     """State for an active transform drag operation."""
@@ -103,10 +105,9 @@ class TransformTool:
 
     def handle_key_up(self, key, context):
         # Cancel on Shift release
-        if key in (pygame.K_LSHIFT, pygame.K_RSHIFT):
-            if self.state.is_active:
-                self.state.reset()
-                return ToolResult.handled()
+        if key in _SHIFT_KEYS and self.state.is_active:
+            self.state.reset()
+            return ToolResult.handled()
         return ToolResult.not_handled()
 
     def on_activated(self, context):
@@ -3,6 +3,7 @@
 import pygame
 from pygame import Rect, Surface
 
+from editor.core.pygame_rendering import display_format
 from editor.resources import get_resource_path
 from editor.core.constants import (
     COLOR_BUTTON,
@@ -52,6 +53,23 @@ class CategoryTreeView:
         self.hovered_path: str | None = None
         self.scroll_y = 0
 
+        # Pre-composed row backgrounds (fill + border), keyed by item state
+        self._row_backgrounds = self._build_row_backgrounds()
+
+    def _build_row_backgrounds(self) -> dict[str, Surface]:
+        """Pre-compose one row background surface per item state."""
+        backgrounds = {}
+        for item_state, color, border_color, border_width in (
+            ("normal", COLOR_BUTTON, COLOR_GRID, 1),
+            ("hovered", COLOR_BUTTON_HOVER, COLOR_GRID, 1),
+            ("selected", COLOR_BUTTON_ACTIVE, COLOR_SELECTION, 2),
+        ):
+            surf = Surface((self.rect.width, self.ITEM_HEIGHT))
+            surf.fill(color)
+            pygame.draw.rect(surf, border_color, surf.get_rect(), border_width)
+            backgrounds[item_state] = display_format(surf)
+        return backgrounds
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events. Returns True if handled."""
         if event.type == pygame.MOUSEMOTION:
@@ -120,12 +138,14 @@ class CategoryTreeView:
     def render(self, screen: Surface):
         """Render category tree."""
         # Background
-        pygame.draw.rect(screen, COLOR_PICKER_BG, self.rect)
+        screen.fill(COLOR_PICKER_BG, self.rect)
 
         # Get flattened visible categories
         flattened = self.category_tree.get_flattened_list()
 
-        # Render each category
+        # Collect visible rows, then draw all row backgrounds in one batched call
+        visible_items = []
+        background_blits = []
         for i, (node, depth) in enumerate(flattened):
             item_y = self.rect.y + i * self.ITEM_HEIGHT - self.scroll_y
 
@@ -133,26 +153,20 @@ class CategoryTreeView:
             if item_y + self.ITEM_HEIGHT < self.rect.y or item_y > self.rect.bottom:
                 continue
 
-            item_rect = Rect(self.rect.x, item_y, self.rect.width, self.ITEM_HEIGHT)
-
-            # Background
-            is_selected = node.path == self.selected_path
-            is_hovered = node.path == self.hovered_path
-
-            if is_selected:
-                color = COLOR_BUTTON_ACTIVE
-            elif is_hovered:
-                color = COLOR_BUTTON_HOVER
+            if node.path == self.selected_path:
+                background = self._row_backgrounds["selected"]
+            elif node.path == self.hovered_path:
+                background = self._row_backgrounds["hovered"]
             else:
-                color = COLOR_BUTTON
+                background = self._row_backgrounds["normal"]
 
-            pygame.draw.rect(screen, color, item_rect)
+            background_blits.append((background, (self.rect.x, item_y)))
+            visible_items.append((node, depth, item_y))
 
-            # Border
-            border_color = COLOR_SELECTION if is_selected else COLOR_GRID
-            border_width = 2 if is_selected else 1
-            pygame.draw.rect(screen, border_color, item_rect, border_width)
+        screen.blits(background_blits, doreturn=False)
 
+        # Render each category's icon and text on top of its background
+        for node, depth, item_y in visible_items:
             # Indent
             indent_x = self.rect.x + depth * self.INDENT_SIZE + 5
 
@@ -177,4 +191,7 @@ class CategoryTreeView:
 
     def resize(self, rect: Rect):
         """Update view rectangle (e.g., on window resize)."""
+        width_changed = rect.width != self.rect.width
         self.rect = rect
+        if width_changed:
+            self._row_backgrounds = self._build_row_backgrounds()
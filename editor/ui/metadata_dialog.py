@@ -9,8 +9,9 @@ Allows user to:
 - View putting surface size comparison chart
 """
 
-import json
-from pathlib import Path
+from bisect import bisect_left
+from collections.abc import Sequence
+from functools import lru_cache
 
 import pygame
 from pygame import Rect, Surface
@@ -25,17 +26,24 @@ from editor.core.constants import (
 )
 from editor.resources import get_resource_path
 from golf.formats.hole_data import HoleData
-from golf.formats.putting_surface import count_putting_surface_tiles
 
 
-def _load_vanilla_sizes() -> list[int]:
-    """Load pre-computed putting surface sizes from data file."""
+@lru_cache(maxsize=1)
+def _load_vanilla_sizes() -> tuple[int, ...]:
+    """
+    Load pre-computed putting surface sizes from data file, sorted ascending.
+
+    The file never changes while the editor runs, so it is read once and
+    shared by every dialog.
+    """
+    import json
+
     data_path = get_resource_path("data/statistics/putting_surface_sizes.json")
     if data_path.exists():
         with open(data_path) as f:
             data = json.load(f)
-            return data.get("sizes", [])
-    return []
+            return tuple(sorted(data.get("sizes", ())))
+    return ()
 
 
 class MetadataDialog:
@@ -43,9 +51,13 @@ class MetadataDialog:
 
     # Validation error color
     COLOR_ERROR = (255, 50, 50)
-    # Chart colors
+    # Chart colors and dot sizes
     COLOR_VANILLA_DOT = (128, 128, 128)  # Gray for vanilla holes
     COLOR_CURRENT_DOT = (255, 230, 50)   # Yellow for current hole
+    VANILLA_DOT_RADIUS = 3
+    CURRENT_DOT_RADIUS = 5
+    # Max rendered field-value surfaces kept by _value_text
+    VALUE_TEXT_CACHE_SIZE = 16
 
     def __init__(
         self,
@@ -72,6 +84,9 @@ class MetadataDialog:
         self.dialog_width = 400
         self.dialog_height = 340
 
+        # Deferred until a dialog is opened so editor startup doesn't pay for it
+        from golf.formats.putting_surface import count_putting_surface_tiles
+
         # Load vanilla sizes and calculate current hole's size
         self.vanilla_sizes = _load_vanilla_sizes()
         self.current_size = count_putting_surface_tiles(hole_data.greens)
@@ -95,8 +110,29 @@ class MetadataDialog:
         self.distance_active = False
         self.distance_valid = self._validate_distance(self.distance_value)
 
+        # Rendered text surfaces: static labels live for the dialog's lifetime,
+        # field values go through a small LRU since they change while typing
+        self._static_text: dict[tuple[str, tuple[int, int, int]], Surface] = {}
+        self._value_text_cache: dict[tuple[str, tuple[int, int, int]], Surface] = {}
+
         # Calculate layout
         self._calculate_layout()
+        self._calculate_chart()
+
+        # Semi-transparent overlay, built once and blitted every frame
+        self._overlay = Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 200))
+        self._overlay = self._overlay.convert_alpha()
+
+        # Dialog contents (everything but the hover-sensitive buttons) are
+        # captured here and only redrawn when an input event changes them
+        self._composite = Surface(self.dialog_rect.size)
+        self._dirty = True
+
+        for text in ("Edit Hole Metadata", "Par:", "Distance:", "Save", "Cancel"):
+            self._text(text, COLOR_TEXT)
+        for text in ("(3-7)", "(100-999 yards)"):
+            self._text(text, COLOR_GRID)
 
         # Result tracking
         self.saved = False
@@ -179,13 +215,97 @@ class MetadataDialog:
             button_height,
         )
 
+    def _calculate_chart(self):
+        """Calculate strip chart geometry and dot positions (fixed for the dialog's lifetime)."""
+        if not self.vanilla_sizes:
+            return  # Nothing to chart
+
+        # Calculate bounds
+        self._min_size = self.vanilla_sizes[0]
+        self._max_size = self.vanilla_sizes[-1]
+        range_size = self._max_size - self._min_size
+        if range_size == 0:
+            range_size = 1  # Avoid division by zero
+
+        # Chart dimensions
+        self._chart_left = self.chart_rect.x + 30  # Leave room for min label
+        self._chart_right = self.chart_rect.right - 30  # Leave room for max label
+        chart_width = self._chart_right - self._chart_left
+        self._chart_center_y = self.chart_rect.y + 40  # Center line for dots (below title)
+
+        # Vanilla dot centers, with jitter applied
+        self._vanilla_dot_centers = [
+            (int(x), int(self._chart_center_y + y_offset))
+            for x, y_offset in self._compute_jitter_positions(
+                self.vanilla_sizes, self._chart_left, chart_width, range_size, self._min_size
+            )
+        ]
+
+        # Current hole position, clamped to chart bounds
+        current_x = (
+            self._chart_left + (self.current_size - self._min_size) / range_size * chart_width
+        )
+        self._current_center = (
+            int(max(self._chart_left, min(self._chart_right, current_x))),
+            self._chart_center_y,
+        )
+
+        # Percentile of the current hole among vanilla holes
+        below_count = bisect_left(self.vanilla_sizes, self.current_size)
+        percentile = int(below_count / len(self.vanilla_sizes) * 100)
+        percentile_text = f"{self.current_size} tiles ({percentile}th percentile)"
+
+        # Axis line endpoints
+        self._axis_start = (self._chart_left, self._chart_center_y)
+        self._axis_end = (self._chart_right, self._chart_center_y)
+
+        # Static labels and their positions
+        self._chart_title_surf = self._text("Putting Surface Size", COLOR_TEXT)
+        self._chart_title_rect = self._chart_title_surf.get_rect(
+            centerx=self.chart_rect.centerx,
+            y=self.chart_rect.y,
+        )
+        self._min_label_surf = self._text(str(self._min_size), COLOR_GRID)
+        self._min_label_rect = self._min_label_surf.get_rect(
+            right=self._chart_left - 5,
+            centery=self._chart_center_y,
+        )
+        self._max_label_surf = self._text(str(self._max_size), COLOR_GRID)
+        self._max_label_rect = self._max_label_surf.get_rect(
+            left=self._chart_right + 5,
+            centery=self._chart_center_y,
+        )
+        self._percentile_surf = self._text(percentile_text, COLOR_TEXT)
+        self._percentile_rect = self._percentile_surf.get_rect(
+            centerx=self.chart_rect.centerx,
+            top=self._chart_center_y + 15,
+        )
+
+    def _text(self, text: str, color: tuple[int, int, int]) -> Surface:
+        """Render static dialog text, memoized for the dialog's lifetime."""
+        key = (text, color)
+        surf = self._static_text.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            self._static_text[key] = surf
+        return surf
+
+    def _value_text(self, text: str, color: tuple[int, int, int]) -> Surface:
+        """Render field value text through a small LRU cache."""
+        key = (text, color)
+        surf = self._value_text_cache.pop(key, None)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            if len(self._value_text_cache) >= self.VALUE_TEXT_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is least recently used
+                del self._value_text_cache[next(iter(self._value_text_cache))]
+        self._value_text_cache[key] = surf
+        return surf
+
     def _validate_par(self, value_str: str) -> bool:
         """Validate par value (must be integer 3-7)."""
-        try:
-            par = int(value_str)
-            return 3 <= par <= 7
-        except ValueError:
-            return False
+        # isdecimal() accepts exactly the digit strings int() parses (not e.g. superscripts)
+        return value_str.isdecimal() and 3 <= int(value_str) <= 7
 
     def _validate_distance(self, value_str: str) -> bool:
         """
@@ -194,11 +314,7 @@ class MetadataDialog:
         Note: The game always stores these as three digit numbers,
         but there is nothing stopping us from using a leading zero.
         """
-        try:
-            distance = int(value_str)
-            return 10 <= distance <= 999
-        except ValueError:
-            return False
+        return value_str.isdecimal() and 10 <= int(value_str) <= 999
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -207,6 +323,9 @@ class MetadataDialog:
         Returns:
             True if dialog should close, False otherwise
         """
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+            self._dirty = True
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check buttons
             if self.save_button_rect.collidepoint(event.pos):
@@ -289,17 +408,29 @@ class MetadataDialog:
     def render(self, screen: Surface):
         """Render the dialog."""
         # Semi-transparent overlay
-        overlay = Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
+
+        # Dialog contents, redrawn only when dirty
+        if self._dirty:
+            self._render_contents(screen)
+            self._composite.blit(screen, (0, 0), self.dialog_rect)
+            self._dirty = False
+        else:
+            screen.blit(self._composite, self.dialog_rect)
+
+        # Buttons (query the mouse once for both hover checks)
+        mouse_pos = pygame.mouse.get_pos()
+        self._render_button(screen, self.save_button_rect, "Save", mouse_pos)
+        self._render_button(screen, self.cancel_button_rect, "Cancel", mouse_pos)
 
+    def _render_contents(self, screen: Surface):
+        """Render dialog background, title, fields and chart (not the buttons)."""
         # Dialog background
         pygame.draw.rect(screen, COLOR_PICKER_BG, self.dialog_rect)
         pygame.draw.rect(screen, COLOR_GRID, self.dialog_rect, 2)
 
         # Title
-        title_surf = self.font.render("Edit Hole Metadata", True, COLOR_TEXT)
+        title_surf = self._text("Edit Hole Metadata", COLOR_TEXT)
         title_rect = title_surf.get_rect(
             centerx=self.dialog_rect.centerx,
             y=self.title_y,
@@ -309,51 +440,46 @@ class MetadataDialog:
         # Par label and input
         self._render_field(
             screen,
-            "Par:",
+            self._text("Par:", COLOR_TEXT),
             self.par_label_rect,
             self.par_input_rect,
             self.par_hint_rect,
             self.par_value,
             self.par_active,
             self.par_valid,
-            "(3-7)",
+            self._text("(3-7)", COLOR_GRID),
         )
 
         # Distance label and input
         self._render_field(
             screen,
-            "Distance:",
+            self._text("Distance:", COLOR_TEXT),
             self.distance_label_rect,
             self.distance_input_rect,
             self.distance_hint_rect,
             self.distance_value,
             self.distance_active,
             self.distance_valid,
-            "(100-999 yards)",
+            self._text("(100-999 yards)", COLOR_GRID),
         )
 
         # Strip chart
         self._render_strip_chart(screen)
 
-        # Buttons
-        self._render_button(screen, self.save_button_rect, "Save")
-        self._render_button(screen, self.cancel_button_rect, "Cancel")
-
     def _render_field(
         self,
         screen: Surface,
-        label: str,
+        label_surf: Surface,
         label_rect: Rect,
         input_rect: Rect,
         hint_rect: Rect,
         value: str,
         is_active: bool,
         is_valid: bool,
-        hint_text: str,
+        hint_surf: Surface,
     ):
-        """Render a text input field with label and hint."""
+        """Render a text input field with pre-rendered label and hint."""
         # Label
-        label_surf = self.font.render(label, True, COLOR_TEXT)
         label_pos = label_surf.get_rect(
             left=label_rect.left,
             centery=label_rect.centery,
@@ -375,9 +501,9 @@ class MetadataDialog:
 
         # Value text (or placeholder if empty)
         if value:
-            value_surf = self.font.render(value, True, COLOR_TEXT)
+            value_surf = self._value_text(value, COLOR_TEXT)
         else:
-            value_surf = self.font.render("", True, COLOR_GRID)
+            value_surf = self._value_text("", COLOR_GRID)
 
         value_pos = value_surf.get_rect(
             left=input_rect.left + 5,
@@ -386,22 +512,23 @@ class MetadataDialog:
         screen.blit(value_surf, value_pos)
 
         # Hint text
-        hint_surf = self.font.render(hint_text, True, COLOR_GRID)
         hint_pos = hint_surf.get_rect(
             left=hint_rect.left,
             centery=hint_rect.centery,
         )
         screen.blit(hint_surf, hint_pos)
 
-    def _render_button(self, screen: Surface, rect: Rect, text: str):
-        """Render a button."""
-        is_hovered = rect.collidepoint(pygame.mouse.get_pos())
+    def _render_button(
+        self, screen: Surface, rect: Rect, text: str, mouse_pos: tuple[int, int]
+    ):
+        """Render a button, highlighted if mouse_pos is over it."""
+        is_hovered = rect.collidepoint(mouse_pos)
         color = COLOR_BUTTON_HOVER if is_hovered else COLOR_BUTTON
 
         pygame.draw.rect(screen, color, rect)
         pygame.draw.rect(screen, COLOR_GRID, rect, 1)
 
-        text_surf = self.font.render(text, True, COLOR_TEXT)
+        text_surf = self._text(text, COLOR_TEXT)
         text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -410,104 +537,32 @@ class MetadataDialog:
         if not self.vanilla_sizes:
             return  # No data to display
 
-        # Calculate bounds
-        min_size = min(self.vanilla_sizes)
-        max_size = max(self.vanilla_sizes)
-        range_size = max_size - min_size
-        if range_size == 0:
-            range_size = 1  # Avoid division by zero
-
-        # Chart dimensions
-        chart_left = self.chart_rect.x + 30  # Leave room for min label
-        chart_right = self.chart_rect.right - 30  # Leave room for max label
-        chart_width = chart_right - chart_left
-        chart_center_y = self.chart_rect.y + 40  # Center line for dots (below title)
-        dot_radius = 3  # Vanilla dots
-        current_dot_radius = 5  # Current hole dot
-
         # Title label
-        title_surf = self.font.render("Putting Surface Size", True, COLOR_TEXT)
-        title_rect = title_surf.get_rect(
-            centerx=self.chart_rect.centerx,
-            y=self.chart_rect.y,
-        )
-        screen.blit(title_surf, title_rect)
+        screen.blit(self._chart_title_surf, self._chart_title_rect)
 
         # Draw axis line
-        pygame.draw.line(
-            screen,
-            COLOR_GRID,
-            (chart_left, chart_center_y),
-            (chart_right, chart_center_y),
-            1,
-        )
+        pygame.draw.line(screen, COLOR_GRID, self._axis_start, self._axis_end, 1)
 
         # Draw min/max labels
-        min_label = self.font.render(str(min_size), True, COLOR_GRID)
-        min_rect = min_label.get_rect(
-            right=chart_left - 5,
-            centery=chart_center_y,
-        )
-        screen.blit(min_label, min_rect)
-
-        max_label = self.font.render(str(max_size), True, COLOR_GRID)
-        max_rect = max_label.get_rect(
-            left=chart_right + 5,
-            centery=chart_center_y,
-        )
-        screen.blit(max_label, max_rect)
-
-        # Compute jitter positions for vanilla dots
-        jitter_positions = self._compute_jitter_positions(
-            self.vanilla_sizes, chart_left, chart_width, range_size, min_size
-        )
+        screen.blit(self._min_label_surf, self._min_label_rect)
+        screen.blit(self._max_label_surf, self._max_label_rect)
 
         # Draw vanilla dots with jitter
-        for x, y_offset in jitter_positions:
-            pygame.draw.circle(
-                screen,
-                self.COLOR_VANILLA_DOT,
-                (int(x), int(chart_center_y + y_offset)),
-                dot_radius,
-            )
-
-        # Calculate current hole position
-        current_x = chart_left + (self.current_size - min_size) / range_size * chart_width
-        # Clamp to chart bounds
-        current_x = max(chart_left, min(chart_right, current_x))
+        for center in self._vanilla_dot_centers:
+            pygame.draw.circle(screen, self.COLOR_VANILLA_DOT, center, self.VANILLA_DOT_RADIUS)
 
-        # Draw current hole dot (larger, yellow)
-        pygame.draw.circle(
-            screen,
-            self.COLOR_CURRENT_DOT,
-            (int(current_x), chart_center_y),
-            current_dot_radius,
-        )
-        # Add outline for visibility
+        # Draw current hole dot (larger, yellow), with outline for visibility
         pygame.draw.circle(
-            screen,
-            COLOR_GRID,
-            (int(current_x), chart_center_y),
-            current_dot_radius,
-            1,
+            screen, self.COLOR_CURRENT_DOT, self._current_center, self.CURRENT_DOT_RADIUS
         )
-
-        # Calculate percentile
-        below_count = sum(1 for s in self.vanilla_sizes if s < self.current_size)
-        percentile = int(below_count / len(self.vanilla_sizes) * 100)
+        pygame.draw.circle(screen, COLOR_GRID, self._current_center, self.CURRENT_DOT_RADIUS, 1)
 
         # Draw percentile text below chart
-        percentile_text = f"{self.current_size} tiles ({percentile}th percentile)"
-        percentile_surf = self.font.render(percentile_text, True, COLOR_TEXT)
-        percentile_rect = percentile_surf.get_rect(
-            centerx=self.chart_rect.centerx,
-            top=chart_center_y + 15,
-        )
-        screen.blit(percentile_surf, percentile_rect)
+        screen.blit(self._percentile_surf, self._percentile_rect)
 
     def _compute_jitter_positions(
         self,
-        sizes: list[int],
+        sizes: Sequence[int],
         chart_left: float,
         chart_width: float,
         range_size: float,
@@ -526,36 +581,38 @@ class MetadataDialog:
         Returns:
             List of (x, y_offset) tuples
         """
+        import numpy as np
+
         # Group sizes by their x position (with some tolerance)
         tolerance = chart_width / 50  # Jitter when within ~2% of chart width
-        positions = []
-
-        # Calculate x positions first
-        x_positions = []
-        for size in sizes:
-            x = chart_left + (size - min_size) / range_size * chart_width
-            x_positions.append(x)
-
-        # Sort indices by x position for grouping
-        sorted_indices = sorted(range(len(x_positions)), key=lambda i: x_positions[i])
-
-        # Group nearby points and apply vertical jitter
         jitter_spacing = 5  # Pixels between stacked dots
-        i = 0
-        while i < len(sorted_indices):
-            # Find all points within tolerance of current point
-            group_start = i
-            base_x = x_positions[sorted_indices[i]]
-
-            while i < len(sorted_indices) and x_positions[sorted_indices[i]] - base_x < tolerance:
-                i += 1
 
-            group_size = i - group_start
+        # Calculate x positions, sorted for grouping
+        x_positions = chart_left + (np.asarray(sizes) - min_size) / range_size * chart_width
+        x_sorted = np.sort(x_positions, kind="stable")
 
-            # Apply vertical jitter to group (centered on axis)
-            for j in range(group_size):
-                idx = sorted_indices[group_start + j]
-                offset = (j - (group_size - 1) / 2) * jitter_spacing
-                positions.append((x_positions[idx], offset))
-
-        return positions
+        # Find group boundaries: each group spans the points within tolerance of
+        # its first point, so the next group starts at the first point past that
+        group_starts = []
+        count = len(x_sorted)
+        i = 0
+        while i < count:
+            group_starts.append(i)
+            start_x = x_sorted[i]
+            j = int(np.searchsorted(x_sorted, start_x + tolerance, side="left"))
+            # start_x + tolerance may round across a point; settle the boundary on
+            # the same x - start_x < tolerance test that defines the group
+            while j > i + 1 and x_sorted[j - 1] - start_x >= tolerance:
+                j -= 1
+            while j < count and x_sorted[j] - start_x < tolerance:
+                j += 1
+            i = max(j, i + 1)
+        breaks = np.array(group_starts + [len(x_sorted)])
+
+        # Apply vertical jitter to each group (centered on axis)
+        group_sizes = np.diff(breaks)
+        group_ids = np.repeat(np.arange(len(group_sizes)), group_sizes)
+        ranks = np.arange(len(x_sorted)) - breaks[group_ids]
+        offsets = (ranks - (group_sizes[group_ids] - 1) / 2) * jitter_spacing
+
+        return list(zip(x_sorted.tolist(), offsets.tolist(), strict=True))
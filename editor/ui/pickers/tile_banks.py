@@ -5,40 +5,89 @@ This module provides reusable tile organization components that handle
 layout, rendering, and hit detection for groups of tiles.
 """
 
+from bisect import bisect_right
+from collections.abc import Sequence
 
 import pygame
 from pygame import Rect, Surface
 
 from editor.core.constants import (
     COLOR_GRID,
+    COLOR_PICKER_BG,
     COLOR_SELECTION,
     COLOR_TEXT,
     TILE_SIZE,
 )
-from editor.core.pygame_rendering import Tileset, render_placeholder_tile
+from editor.core.pygame_rendering import Tileset, atlas_areas
 from editor.rendering.font_cache import get_font
 
+_label_cache: dict[tuple[str, int, tuple[int, int, int]], Surface] = {}
 
-def range_to_list(min: int, max: int) -> list[int]:
-    return list(range(min, max))
+def render_label(text: str, size: int, color: tuple[int, int, int]) -> Surface:
+    """Render a monospace bank/subbank label, reusing the surface across frames."""
+    key = (text, size, color)
+    if key not in _label_cache:
+        _label_cache[key] = get_font("monospace", size).render(text, True, color)
+    return _label_cache[key]
+
+
+_offsets_cache: dict[tuple[int, int, int], tuple[tuple[int, int], ...]] = {}
+
+def tile_offsets(
+    num_tiles: int, tiles_per_row: int, tile_size: int
+) -> tuple[tuple[int, int], ...]:
+    """Get each tile's (dx, dy) offset from the grid origin, in layout order."""
+    key = (num_tiles, tiles_per_row, tile_size)
+    if key not in _offsets_cache:
+        _offsets_cache[key] = tuple(
+            ((i % tiles_per_row) * tile_size, (i // tiles_per_row) * tile_size)
+            for i in range(num_tiles)
+        )
+    return _offsets_cache[key]
+
+
+_outline_cache: dict[int, Surface] = {}
+
+def selection_outline(tile_scale: int) -> Surface:
+    """Get the 2px selection border drawn around a selected tile (1px outside it)."""
+    if tile_scale in _outline_cache:
+        return _outline_cache[tile_scale]
+
+    size = TILE_SIZE * tile_scale + 2
+    surf = Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.rect(surf, COLOR_SELECTION, surf.get_rect(), 2)
+
+    surf = surf.convert_alpha()
+    _outline_cache[tile_scale] = surf
+    return surf
+
+
+def blit_clipped(screen: Surface, surface: Surface, x: int, y: int, clip_rect: Rect):
+    """Blit the part of surface, placed at (x, y), that falls inside clip_rect."""
+    visible = clip_rect.clip(Rect((x, y), surface.get_size()))
+    if visible:
+        screen.blit(surface, visible, visible.move(-x, -y))
 
 
 class TileSubBank:
     """A labeled subgroup of tiles within a bank."""
 
-    def __init__(self, label: str, tile_indices: list[int]):
+    def __init__(self, label: str, tile_indices: Sequence[int]):
         """
         Args:
             label: Display name for this subbank (e.g., "Borders With Depth")
-            tile_indices: List of tile index values for this subbank
+            tile_indices: Tile index values for this subbank
         """
         self.label = label
-        self.tile_indices = tile_indices
+        self.tile_indices = tuple(tile_indices)  # Frozen: layout is fixed
 
         # Layout constants
         self.label_height = 14  # Smaller than bank labels
         self.spacing_before = 4  # Vertical spacing before this subbank
 
+        # Heights already computed, keyed by (tiles_per_row, tile_scale, tile_spacing)
+        self._height_cache: dict[tuple[int, int, int], int] = {}
+
     def get_height(self, tiles_per_row: int, tile_scale: int, tile_spacing: int) -> int:
         """
         Calculate total rendered height of this subbank.
@@ -51,45 +100,50 @@ class TileSubBank:
         Returns:
             Total height in pixels including label and tiles
         """
-        # Calculate grid dimensions
-        num_tiles = len(self.tile_indices)
-        num_rows = (num_tiles + tiles_per_row - 1) // tiles_per_row
+        layout_key = (tiles_per_row, tile_scale, tile_spacing)
+        height = self._height_cache.get(layout_key)
+        if height is None:
+            # Calculate grid dimensions
+            num_tiles = len(self.tile_indices)
+            num_rows = (num_tiles + tiles_per_row - 1) // tiles_per_row
 
-        tile_size = TILE_SIZE * tile_scale + tile_spacing
-        tiles_height = num_rows * tile_size
+            tile_size = TILE_SIZE * tile_scale + tile_spacing
+            tiles_height = num_rows * tile_size
+
+            # Total: spacing before + label + tiles
+            height = self.spacing_before + self.label_height + tiles_height
+            self._height_cache[layout_key] = height
+        return height
 
-        # Total: spacing before + label + tiles
-        return self.spacing_before + self.label_height + tiles_height
+    def get_atlas(self, tileset: Tileset, palette_idx: int, tile_scale: int) -> Surface:
+        """Get the tile atlas this subbank draws from."""
+        return tileset.get_atlas(palette_idx, tile_scale)
 
     def render(
         self,
-        screen: Surface,
+        surface: Surface,
         x: int,
         y: int,
-        width: int,
         tileset: Tileset,
         palette_idx: int,
-        selected_tile: int | None,
         tiles_per_row: int,
         tile_scale: int,
         tile_spacing: int,
-        clip_rect: Rect,
     ) -> int:
         """
-        Render this subbank at the specified position.
+        Render this subbank's label and whole tile grid at the specified position.
+
+        Selection is drawn by the owning bank, over its cached surface.
 
         Args:
-            screen: Pygame surface to draw on
+            surface: Bank surface to draw on
             x: Left edge x coordinate
             y: Top edge y coordinate (includes spacing before)
-            width: Total width available
             tileset: Tileset for rendering tiles
             palette_idx: Palette index for terrain rendering
-            selected_tile: Currently selected tile value (for highlight)
             tiles_per_row: Number of tiles per row
             tile_scale: Tile rendering scale
             tile_spacing: Spacing between tiles
-            clip_rect: Clipping rectangle for scrolling
 
         Returns:
             Height consumed by this subbank
@@ -97,46 +151,23 @@ class TileSubBank:
         current_y = y + self.spacing_before
 
         # 1. Render label text (left-aligned, smaller font)
-        font = get_font("monospace", 10)
-        text_surf = font.render(self.label, True, COLOR_GRID)  # Subtle gray color
-        screen.blit(text_surf, (x, current_y))
+        text_surf = render_label(self.label, 10, COLOR_GRID)  # Subtle gray color
+        surface.blit(text_surf, (x, current_y))
 
         current_y += self.label_height
 
-        # 2. Render tiles in grid
+        # 2. Render tiles in grid, from the atlas (slot 0x100 holds the placeholder)
         tile_size = TILE_SIZE * tile_scale + tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % tiles_per_row
-            row = i // tiles_per_row
-
-            tile_x = x + col * tile_size
-            tile_y = current_y + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
-
-            # Render tile (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * tile_scale)
-            else:
-                tile_surf = tileset.render_tile(tile_idx, palette_idx, tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * tile_scale + 2,
-                        TILE_SIZE * tile_scale + 2,
-                    ),
-                    2,
-                )
+        atlas = self.get_atlas(tileset, palette_idx, tile_scale)
+        areas = atlas_areas(tile_scale)
+        offsets = tile_offsets(len(self.tile_indices), tiles_per_row, tile_size)
+        surface.blits(
+            [
+                (atlas, (x + dx, current_y + dy), areas[tile_idx])
+                for tile_idx, (dx, dy) in zip(self.tile_indices, offsets, strict=True)
+            ],
+            doreturn=False,
+        )
 
         return self.get_height(tiles_per_row, tile_scale, tile_spacing)
 
@@ -144,84 +175,9 @@ class TileSubBank:
 class TileSubBankGreens(TileSubBank):
     """TileSubBank variant that uses greens palette rendering."""
 
-    def render(
-        self,
-        screen: Surface,
-        x: int,
-        y: int,
-        width: int,
-        tileset: Tileset,
-        palette_idx: int,  # Ignored for greens, kept for API compatibility
-        selected_tile: int | None,
-        tiles_per_row: int,
-        tile_scale: int,
-        tile_spacing: int,
-        clip_rect: Rect,
-    ) -> int:
-        """
-        Render this subbank at the specified position using greens palette.
-
-        Args:
-            screen: Pygame surface to draw on
-            x: Left edge x coordinate
-            y: Top edge y coordinate (includes spacing before)
-            width: Total width available
-            tileset: Tileset for rendering tiles
-            palette_idx: Palette index (ignored for greens, kept for API compatibility)
-            selected_tile: Currently selected tile value (for highlight)
-            tiles_per_row: Number of tiles per row
-            tile_scale: Tile rendering scale
-            tile_spacing: Spacing between tiles
-            clip_rect: Clipping rectangle for scrolling
-
-        Returns:
-            Height consumed by this subbank
-        """
-        current_y = y + self.spacing_before
-
-        # 1. Render label text (left-aligned, smaller font)
-        font = get_font("monospace", 10)
-        text_surf = font.render(self.label, True, COLOR_GRID)  # Subtle gray color
-        screen.blit(text_surf, (x, current_y))
-
-        current_y += self.label_height
-
-        # 2. Render tiles in grid
-        tile_size = TILE_SIZE * tile_scale + tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % tiles_per_row
-            row = i // tiles_per_row
-
-            tile_x = x + col * tile_size
-            tile_y = current_y + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
-
-            # Render tile using greens palette (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * tile_scale)
-            else:
-                tile_surf = tileset.render_tile_greens(tile_idx, tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * tile_scale + 2,
-                        TILE_SIZE * tile_scale + 2,
-                    ),
-                    2,
-                )
-
-        return self.get_height(tiles_per_row, tile_scale, tile_spacing)
+    def get_atlas(self, tileset: Tileset, palette_idx: int, tile_scale: int) -> Surface:
+        """Get the greens-palette tile atlas (palette_idx is ignored)."""
+        return tileset.get_atlas_greens(tile_scale)
 
 
 class SimpleTileBank:
@@ -230,7 +186,7 @@ class SimpleTileBank:
     def __init__(
         self,
         label: str,
-        tile_indices: list[int],
+        tile_indices: Sequence[int],
         tiles_per_row: int,
         tile_scale: int,
         tile_spacing: int = 2,
@@ -238,13 +194,13 @@ class SimpleTileBank:
         """
         Args:
             label: Display name for this bank (e.g., "Rough", "Fringe")
-            tile_indices: List of tile index values for this bank
+            tile_indices: Tile index values for this bank
             tiles_per_row: Number of tiles per row (from parent picker)
             tile_scale: Tile rendering scale (from parent picker)
             tile_spacing: Spacing between tiles in pixels
         """
         self.label = label
-        self.tile_indices = tile_indices
+        self.tile_indices = tuple(tile_indices)  # Frozen: layout is fixed
         self.tiles_per_row = tiles_per_row
         self.tile_scale = tile_scale
         self.tile_spacing = tile_spacing
@@ -254,6 +210,19 @@ class SimpleTileBank:
         self.border_width = 1  # Border line thickness
         self.padding = 4  # Internal padding around tiles
 
+        # Row/column pitch of the tile grid
+        self._tile_size = TILE_SIZE * tile_scale + tile_spacing
+
+        # Layout is fixed, so the height only needs computing once
+        self._height = self._calculate_height()
+
+        # Label, border and tiles drawn once, keyed by (tileset, palette_idx, width)
+        self._surface: Surface | None = None
+        self._surface_key: tuple[Tileset, int, int] | None = None
+
+        # Selected tile value -> offsets of its occurrences (the layout is fixed)
+        self._selection_offsets: dict[int | None, list[tuple[int, int]]] = {}
+
     def get_height(self) -> int:
         """
         Calculate total rendered height of this bank.
@@ -261,12 +230,15 @@ class SimpleTileBank:
         Returns:
             Total height in pixels including label, tiles, borders, padding
         """
+        return self._height
+
+    def _calculate_height(self) -> int:
+        """Calculate total rendered height of this bank from its fixed layout."""
         # Calculate grid dimensions
         num_tiles = len(self.tile_indices)
         num_rows = (num_tiles + self.tiles_per_row - 1) // self.tiles_per_row
 
-        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
-        tiles_height = num_rows * tile_size
+        tiles_height = num_rows * self._tile_size
 
         # Total: label + top padding + tiles + bottom padding + bottom border
         return (
@@ -281,6 +253,10 @@ class SimpleTileBank:
         """Return number of tiles in this bank."""
         return len(self.tile_indices)
 
+    def get_atlas(self, tileset: Tileset, palette_idx: int, tile_scale: int) -> Surface:
+        """Get the tile atlas this bank draws from."""
+        return tileset.get_atlas(palette_idx, tile_scale)
+
     def render(
         self,
         screen: Surface,
@@ -307,58 +283,78 @@ class SimpleTileBank:
             hovered_tile: Currently hovered tile value (for highlight)
             clip_rect: Clipping rectangle for scrolling
         """
+        # Bank contents are cached; only the selection outline is drawn per call
+        blit_clipped(screen, self._get_surface(width, tileset, palette_idx), x, y, clip_rect)
+
+        outline = selection_outline(self.tile_scale)
+        for dx, dy in self._selected_tile_offsets(selected_tile):
+            blit_clipped(screen, outline, x + dx - 1, y + dy - 1, clip_rect)
+
+    def _get_surface(self, width: int, tileset: Tileset, palette_idx: int) -> Surface:
+        """Get the bank's label, border and tiles drawn into a cached surface."""
+        surface_key = (tileset, palette_idx, width)
+        if surface_key != self._surface_key:
+            surface = Surface((width, self.get_height())).convert()
+            surface.fill(COLOR_PICKER_BG)
+            self._draw_contents(surface, width, tileset, palette_idx)
+            self._surface = surface
+            self._surface_key = surface_key
+        return self._surface
+
+    def _draw_contents(self, surface: Surface, width: int, tileset: Tileset, palette_idx: int):
+        """Draw the whole bank (without selection) at the origin of surface."""
         # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
+        label_rect = Rect(0, 0, width, self.label_height)
+        surface.fill(COLOR_GRID, label_rect)
 
         # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
+        text_surf = render_label(self.label, 12, COLOR_TEXT)
+        text_x = (width - text_surf.get_width()) // 2
+        text_y = (self.label_height - text_surf.get_height()) // 2
+        surface.blit(text_surf, (text_x, text_y))
 
         # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
+        pygame.draw.rect(surface, COLOR_GRID, surface.get_rect(), self.border_width)
 
         # 4. Render tiles in grid
-        tile_y_start = y + self.label_height + self.padding
-        tile_x_start = x + self.padding
-        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % self.tiles_per_row
-            row = i // self.tiles_per_row
-
-            tile_x = tile_x_start + col * tile_size
-            tile_y = tile_y_start + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
+        tile_y_start = self.label_height + self.padding
+        tile_x_start = self.padding
+        atlas = self.get_atlas(tileset, palette_idx, self.tile_scale)
+        areas = atlas_areas(self.tile_scale)
+        offsets = tile_offsets(len(self.tile_indices), self.tiles_per_row, self._tile_size)
+
+        # Queue tiles from the atlas (slot 0x100 holds the placeholder)
+        surface.blits(
+            [
+                (atlas, (tile_x_start + dx, tile_y_start + dy), areas[tile_idx])
+                for tile_idx, (dx, dy) in zip(self.tile_indices, offsets, strict=True)
+            ],
+            doreturn=False,
+        )
 
-            # Render tile (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * self.tile_scale)
-            else:
-                tile_surf = tileset.render_tile(tile_idx, palette_idx, self.tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * self.tile_scale + 2,
-                        TILE_SIZE * self.tile_scale + 2,
-                    ),
-                    2,
-                )
+    def _selected_tile_offsets(self, selected_tile: int | None) -> list[tuple[int, int]]:
+        """Get the top-left offset, from the bank origin, of each selected tile."""
+        offsets = self._selection_offsets.get(selected_tile)
+        if offsets is None:
+            offsets = self._compute_selected_tile_offsets(selected_tile)
+            self._selection_offsets[selected_tile] = offsets
+        return offsets
+
+    def _compute_selected_tile_offsets(
+        self, selected_tile: int | None
+    ) -> list[tuple[int, int]]:
+        """Find where each occurrence of selected_tile sits in the bank layout."""
+        if selected_tile not in self.tile_indices:
+            return []
+
+        tile_x_start = self.padding
+        tile_y_start = self.label_height + self.padding
+        offsets = tile_offsets(len(self.tile_indices), self.tiles_per_row, self._tile_size)
+        return [
+            (tile_x_start + dx, tile_y_start + dy)
+            for tile_idx, (dx, dy) in zip(self.tile_indices, offsets, strict=True)
+            if tile_idx == selected_tile
+        ]
 
     def get_tile_at_position(
         self,
@@ -400,84 +396,9 @@ class SimpleTileBank:
 class SimpleTileBankGreens(SimpleTileBank):
     """SimpleTileBank variant that uses greens palette rendering."""
 
-    def render(
-        self,
-        screen: Surface,
-        x: int,
-        y: int,
-        width: int,
-        tileset: Tileset,
-        palette_idx: int,  # Ignored for greens, kept for API compatibility
-        selected_tile: int | None,
-        hovered_tile: int | None,
-        clip_rect: Rect,
-    ):
-        """
-        Render this bank at the specified position using greens palette.
-
-        Args:
-            screen: Pygame surface to draw on
-            x: Left edge x coordinate
-            y: Top edge y coordinate (includes label)
-            width: Total width of bank
-            tileset: Tileset for rendering tiles
-            palette_idx: Palette index (ignored for greens, kept for API compatibility)
-            selected_tile: Currently selected tile value (for highlight)
-            hovered_tile: Currently hovered tile value (for highlight)
-            clip_rect: Clipping rectangle for scrolling
-        """
-        # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
-
-        # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
-
-        # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
-
-        # 4. Render tiles in grid
-        tile_y_start = y + self.label_height + self.padding
-        tile_x_start = x + self.padding
-        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
-
-        for i, tile_idx in enumerate(self.tile_indices):
-            col = i % self.tiles_per_row
-            row = i // self.tiles_per_row
-
-            tile_x = tile_x_start + col * tile_size
-            tile_y = tile_y_start + row * tile_size
-
-            # Skip if outside clip rect
-            if tile_y + tile_size < clip_rect.y or tile_y > clip_rect.bottom:
-                continue
-
-            # Render tile using greens palette (special handling for 0x100 placeholder)
-            if tile_idx == 0x100:
-                tile_surf = render_placeholder_tile(TILE_SIZE * self.tile_scale)
-            else:
-                tile_surf = tileset.render_tile_greens(tile_idx, self.tile_scale)
-            screen.blit(tile_surf, (tile_x, tile_y))
-
-            # Selection highlight
-            if tile_idx == selected_tile:
-                pygame.draw.rect(
-                    screen,
-                    COLOR_SELECTION,
-                    (
-                        tile_x - 1,
-                        tile_y - 1,
-                        TILE_SIZE * self.tile_scale + 2,
-                        TILE_SIZE * self.tile_scale + 2,
-                    ),
-                    2,
-                )
+    def get_atlas(self, tileset: Tileset, palette_idx: int, tile_scale: int) -> Surface:
+        """Get the greens-palette tile atlas (palette_idx is ignored)."""
+        return tileset.get_atlas_greens(tile_scale)
 
 
 class GroupedTileBank:
@@ -510,6 +431,18 @@ class GroupedTileBank:
         self.border_width = 1  # Border line thickness
         self.padding = 4  # Internal padding around tiles
 
+        # Subbank y offsets within the content area, cached per layout for hit testing
+        self._subbank_layout_key: tuple[int, int, int] | None = None
+        self._subbank_y_starts: list[int] = []
+        self._subbanks_bottom = 0
+
+        # Label, border and tiles drawn once, keyed by (tileset, palette_idx, width)
+        self._surface: Surface | None = None
+        self._surface_key: tuple[Tileset, int, int] | None = None
+
+        # Selected tile value -> offsets of its occurrences (the layout is fixed)
+        self._selection_offsets: dict[int | None, list[tuple[int, int]]] = {}
+
     def get_height(self) -> int:
         """
         Calculate total rendered height of this bank.
@@ -517,11 +450,9 @@ class GroupedTileBank:
         Returns:
             Total height in pixels including label, subbanks, borders, padding
         """
-        # Sum heights of all subbanks
-        subbanks_height = sum(
-            subbank.get_height(self.tiles_per_row, self.tile_scale, self.tile_spacing)
-            for subbank in self.subbanks
-        )
+        # Total height of all subbanks (cached alongside their y offsets)
+        self._get_subbank_y_starts(self.tiles_per_row, self.tile_scale, self.tile_spacing)
+        subbanks_height = self._subbanks_bottom
 
         # Total: label + top padding + subbanks + bottom padding + bottom border
         return (
@@ -562,41 +493,91 @@ class GroupedTileBank:
             hovered_tile: Currently hovered tile value (for highlight)
             clip_rect: Clipping rectangle for scrolling
         """
+        # Bank contents are cached; only the selection outline is drawn per call
+        blit_clipped(screen, self._get_surface(width, tileset, palette_idx), x, y, clip_rect)
+
+        outline = selection_outline(self.tile_scale)
+        for dx, dy in self._selected_tile_offsets(selected_tile):
+            blit_clipped(screen, outline, x + dx - 1, y + dy - 1, clip_rect)
+
+    def _get_surface(self, width: int, tileset: Tileset, palette_idx: int) -> Surface:
+        """Get the bank's label, border and tiles drawn into a cached surface."""
+        surface_key = (tileset, palette_idx, width)
+        if surface_key != self._surface_key:
+            surface = Surface((width, self.get_height())).convert()
+            surface.fill(COLOR_PICKER_BG)
+            self._draw_contents(surface, width, tileset, palette_idx)
+            self._surface = surface
+            self._surface_key = surface_key
+        return self._surface
+
+    def _draw_contents(self, surface: Surface, width: int, tileset: Tileset, palette_idx: int):
+        """Draw the whole bank (without selection) at the origin of surface."""
         # 1. Draw label background
-        label_rect = Rect(x, y, width, self.label_height)
-        pygame.draw.rect(screen, COLOR_GRID, label_rect)
+        label_rect = Rect(0, 0, width, self.label_height)
+        surface.fill(COLOR_GRID, label_rect)
 
         # 2. Render label text (centered)
-        font = get_font("monospace", 12)
-        text_surf = font.render(self.label, True, COLOR_TEXT)
-        text_x = x + (width - text_surf.get_width()) // 2
-        text_y = y + (self.label_height - text_surf.get_height()) // 2
-        screen.blit(text_surf, (text_x, text_y))
+        text_surf = render_label(self.label, 12, COLOR_TEXT)
+        text_x = (width - text_surf.get_width()) // 2
+        text_y = (self.label_height - text_surf.get_height()) // 2
+        surface.blit(text_surf, (text_x, text_y))
 
         # 3. Draw bank border (around entire bank including label)
-        bank_height = self.get_height()
-        border_rect = Rect(x, y, width, bank_height)
-        pygame.draw.rect(screen, COLOR_GRID, border_rect, self.border_width)
+        pygame.draw.rect(surface, COLOR_GRID, surface.get_rect(), self.border_width)
 
         # 4. Render subbanks
-        current_y = y + self.label_height + self.padding
-        subbank_x = x + self.padding
+        current_y = self.label_height + self.padding
 
         for subbank in self.subbanks:
-            height_consumed = subbank.render(
-                screen,
-                subbank_x,
+            current_y += subbank.render(
+                surface,
+                self.padding,
                 current_y,
-                width - 2 * self.padding,
                 tileset,
                 palette_idx,
-                selected_tile,
                 self.tiles_per_row,
                 self.tile_scale,
                 self.tile_spacing,
-                clip_rect,
             )
-            current_y += height_consumed
+
+    def _selected_tile_offsets(self, selected_tile: int | None) -> list[tuple[int, int]]:
+        """Get the top-left offset, from the bank origin, of each selected tile."""
+        offsets = self._selection_offsets.get(selected_tile)
+        if offsets is None:
+            offsets = self._compute_selected_tile_offsets(selected_tile)
+            self._selection_offsets[selected_tile] = offsets
+        return offsets
+
+    def _compute_selected_tile_offsets(
+        self, selected_tile: int | None
+    ) -> list[tuple[int, int]]:
+        """Find where each occurrence of selected_tile sits in the bank layout."""
+        y_starts = self._get_subbank_y_starts(
+            self.tiles_per_row, self.tile_scale, self.tile_spacing
+        )
+        tile_size = TILE_SIZE * self.tile_scale + self.tile_spacing
+
+        selected_offsets = []
+        for subbank, subbank_y in zip(self.subbanks, y_starts, strict=True):
+            if selected_tile not in subbank.tile_indices:
+                continue
+
+            tile_x_start = self.padding
+            tile_y_start = (
+                self.label_height
+                + self.padding
+                + subbank_y
+                + subbank.spacing_before
+                + subbank.label_height
+            )
+            offsets = tile_offsets(len(subbank.tile_indices), self.tiles_per_row, tile_size)
+            selected_offsets.extend(
+                (tile_x_start + dx, tile_y_start + dy)
+                for tile_idx, (dx, dy) in zip(subbank.tile_indices, offsets, strict=True)
+                if tile_idx == selected_tile
+            )
+        return selected_offsets
 
     def get_tile_at_position(
         self,
@@ -619,41 +600,53 @@ class GroupedTileBank:
         Returns:
             Tile index or None if position is invalid
         """
-        # Search through subbanks to find which one contains this y position
-        current_subbank_y = 0
-        for subbank in self.subbanks:
-            subbank_height = subbank.get_height(tiles_per_row, tile_scale, tile_spacing)
+        y_starts = self._get_subbank_y_starts(tiles_per_row, tile_scale, tile_spacing)
+        if not 0 <= bank_content_y < self._subbanks_bottom:
+            return None  # Outside all subbanks
 
-            if current_subbank_y <= bank_content_y < current_subbank_y + subbank_height:
-                # We're inside this subbank
-                # Position relative to subbank
-                subbank_local_y = bank_content_y - current_subbank_y
+        # Find which subbank contains this y position
+        subbank_num = bisect_right(y_starts, bank_content_y) - 1
+        subbank = self.subbanks[subbank_num]
 
-                # Check if we're in the subbank label area
-                if subbank_local_y < subbank.spacing_before + subbank.label_height:
-                    return None  # Clicked on subbank label
+        # Position relative to subbank
+        subbank_local_y = bank_content_y - y_starts[subbank_num]
 
-                # Position relative to subbank's tile grid
-                tile_area_y = subbank_local_y - (
-                    subbank.spacing_before + subbank.label_height
-                )
+        # Check if we're in the subbank label area
+        if subbank_local_y < subbank.spacing_before + subbank.label_height:
+            return None  # Clicked on subbank label
 
-                tile_size = TILE_SIZE * tile_scale + tile_spacing
-                col = local_x // tile_size
-                row = tile_area_y // tile_size
+        # Position relative to subbank's tile grid
+        tile_area_y = subbank_local_y - (subbank.spacing_before + subbank.label_height)
 
-                # Check bounds
-                if col < 0 or col >= tiles_per_row:
-                    return None
+        tile_size = TILE_SIZE * tile_scale + tile_spacing
+        col = local_x // tile_size
+        row = tile_area_y // tile_size
+
+        # Check bounds
+        if col < 0 or col >= tiles_per_row:
+            return None
 
-                tile_idx = row * tiles_per_row + col
-                if 0 <= tile_idx < len(subbank.tile_indices):
-                    return subbank.tile_indices[tile_idx]
-                return None
+        tile_idx = row * tiles_per_row + col
+        if 0 <= tile_idx < len(subbank.tile_indices):
+            return subbank.tile_indices[tile_idx]
+        return None
 
-            current_subbank_y += subbank_height
+    def _get_subbank_y_starts(
+        self, tiles_per_row: int, tile_scale: int, tile_spacing: int
+    ) -> list[int]:
+        """Get each subbank's top y offset within the content area for the given layout."""
+        layout_key = (tiles_per_row, tile_scale, tile_spacing)
+        if layout_key != self._subbank_layout_key:
+            y_starts = []
+            current_y = 0
+            for subbank in self.subbanks:
+                y_starts.append(current_y)
+                current_y += subbank.get_height(tiles_per_row, tile_scale, tile_spacing)
 
-        return None  # Outside all subbanks
+            self._subbank_y_starts = y_starts
+            self._subbanks_bottom = current_y
+            self._subbank_layout_key = layout_key
+        return self._subbank_y_starts
 
 
 class GroupedTileBankGreens(GroupedTileBank):
@@ -678,5 +671,5 @@ class GroupedTileBankGreens(GroupedTileBank):
             tile_spacing: Pixel spacing between tiles (default 2)
         """
         # Call parent __init__ - it will work with greens subbanks
-        # since they inherit from TileSubBank and only override render()
+        # since they inherit from TileSubBank and only override get_atlas()
         super().__init__(label, subbanks, tiles_per_row, tile_scale, tile_spacing)  # type: ignore[arg-type]
@@ -2,6 +2,7 @@
 Main tile picker panel for terrain tile selection.
 """
 
+from bisect import bisect_left, bisect_right
 
 import pygame
 from pygame import Rect, Surface
@@ -12,21 +13,48 @@ from editor.core.constants import (
 )
 from editor.core.pygame_rendering import Tileset
 
-from .tile_banks import GroupedTileBank, TileSubBank, range_to_list
+from .tile_banks import GroupedTileBank, TileSubBank
+
+_SHIFT_KEYS = frozenset((pygame.K_LSHIFT, pygame.K_RSHIFT))
+
+
+# Subbank tile lists that combine ranges, built once at import
+_LIP_TOP_TILES = (*range(0x42, 0x46), 0x4A, 0x4B, 0x50, 0x53)
+_BORDER_TOP_TILES = (0x5B, *range(0x60, 0x68))
+_BORDER_BOTTOM_TILES = (0x5A, *range(0x70, 0x78))
+_CORNER_TILES = (*range(0x56, 0x5A), 0x40, 0x41)
+_OOB_BORDER_TOP_TILES = (*range(0x8C, 0x90), 0x95, 0x99)
+_OOB_BORDER_BOTTOM_TILES = (*range(0x84, 0x88), 0x94, 0x98)
+_OOB_CORNER_TILES = tuple(range(0x80, 0x84))
+_FOREST_TILES = (
+    (0xA0, *range(0xA4, 0xAA)),
+    (0xA1, *range(0xAA, 0xB0)),
+    (0xA2, *range(0xB0, 0xB6)),
+    (0xA3, *range(0xB6, 0xBC)),
+)
 
 
 class TilePicker:
     """Tile selection panel."""
 
+    DEFAULT_TILE = 0x25  # Rough
+
     def __init__(self, tileset: Tileset, rect: Rect, on_hover_change=None, on_tile_selected=None):
         self.tileset = tileset
         self.rect = rect
+        # Banks are drawn into this surface, which is only redrawn when the
+        # scroll position, selection or palette changes
+        self._composite = Surface(rect.size)
+        self._composite_key: tuple[int, int | None, int] | None = None
+        # Clipping rect for scrolling (5px inset top and bottom), in composite coordinates
+        self._clip_rect = Rect(0, 5, rect.width, rect.height - 10)
         self.scroll_y = 0
-        self.selected_tile = 0x25  # Default to rough
+        self.selected_tile = self.DEFAULT_TILE
         self.tile_scale = 4
-        self.tiles_per_row = (rect.width - 20) // (TILE_SIZE * self.tile_scale + 2)
-
         self.tile_spacing = 2
+        # Distance from one tile to the next in a row or column
+        self.tile_stride = TILE_SIZE * self.tile_scale + self.tile_spacing
+        self.tiles_per_row = (rect.width - 20) // self.tile_stride
 
         # Callback for hover changes
         self.on_hover_change = on_hover_change
@@ -38,7 +66,26 @@ class TilePicker:
         self.shift_held = False
 
         # Create banks with subbanks
-        self.banks = [
+        self.banks = self._create_banks()
+
+        # Spacing between banks (vertical gap)
+        self.bank_spacing = 8
+
+        # Cached bank positions (y-offset for each bank) and scroll limit
+        self._bank_positions = []
+        self._max_scroll = 0
+        self._calculate_bank_positions()
+
+        # Reverse lookup: tile value -> position in the bank hierarchy
+        self._tile_index: dict[int, tuple[int, ...]] = {}
+        self._build_tile_index()
+
+        # Track tile currently under mouse
+        self.hovered_tile = None
+
+    def _create_banks(self) -> list:
+        """Create the picker's banks (subclasses override to pick other tiles)."""
+        return [
             GroupedTileBank(
                 "Meta",
                 [TileSubBank("Placeholder", [0x100])],
@@ -71,17 +118,17 @@ class TilePicker:
             GroupedTileBank(
                 "Features",
                 [
-                    # TileSubBank("Border With Depth", range_to_list(0x40, 0x56)),
-                    # TileSubBank("Borders, Flat", range_to_list(0x56, 0x80)),
-                    TileSubBank("Lip, Top", range_to_list(0x42, 0x46) + [0x4A, 0x4B, 0x50, 0x53]),
+                    # TileSubBank("Border With Depth", tuple(range(0x40, 0x56))),
+                    # TileSubBank("Borders, Flat", tuple(range(0x56, 0x80))),
+                    TileSubBank("Lip, Top", _LIP_TOP_TILES),
                     TileSubBank("Lip, Right", [0x47, 0x49, 0x4D, 0x4F, 0x51]),
                     TileSubBank("Lip, Bottom", [0x54, 0x55]),
                     TileSubBank("Lip, Left", [0x46, 0x48, 0x4C, 0x4E, 0x52]),
-                    TileSubBank("Border, Top", [0x5B] + range_to_list(0x60, 0x68)),
+                    TileSubBank("Border, Top", _BORDER_TOP_TILES),
                     TileSubBank("Border, Right", [0x5D, 0x5F, 0x69, 0x6B, 0x6D, 0x6F, 0x79, 0x7B, 0x7D, 0x7F]),
-                    TileSubBank("Border, Bottom", [0x5A] + range_to_list(0x70, 0x78)),
+                    TileSubBank("Border, Bottom", _BORDER_BOTTOM_TILES),
                     TileSubBank("Border, Left", [0x5C, 0x5E, 0x68, 0x6A, 0x6C, 0x6E, 0x78, 0x7A, 0x7C, 0x7E]),
-                    TileSubBank("Corner", range_to_list(0x56, 0x5A) + [0x40, 0x41]),
+                    TileSubBank("Corner", _CORNER_TILES),
                     TileSubBank("w/ TreeTop", [0xBC, 0xBE]),
                     TileSubBank("w/ TreeBase", [0xBD, 0xBF]),
                 ],
@@ -92,17 +139,17 @@ class TilePicker:
             GroupedTileBank(
                 "Out of bounds",
                 [
-                    # TileSubBank("Border", range_to_list(0x80, 0x9C)),
-                    TileSubBank("Border, Top", range_to_list(0x8C, 0x90) + [0x95, 0x99]),
+                    # TileSubBank("Border", tuple(range(0x80, 0x9C))),
+                    TileSubBank("Border, Top", _OOB_BORDER_TOP_TILES),
                     TileSubBank("Border, Right", [0x88, 0x89, 0x90, 0x91, 0x97, 0x9A]),
-                    TileSubBank("Border, Bottom", range_to_list(0x84, 0x88) + [0x94, 0x98]),
+                    TileSubBank("Border, Bottom", _OOB_BORDER_BOTTOM_TILES),
                     TileSubBank("Border, Left", [0x8A, 0x8B, 0x92, 0x93, 0x96, 0x9B]),
-                    TileSubBank("Corner", range_to_list(0x80, 0x84)),
+                    TileSubBank("Corner", _OOB_CORNER_TILES),
                     TileSubBank("Inner Border", [0x3F]),
-                    TileSubBank("Forest 0", [0xA0] + range_to_list(0xA4, 0xAA)),
-                    TileSubBank("Forest 1", [0xA1] + range_to_list(0xAA, 0xB0)),
-                    TileSubBank("Forest 2", [0xA2] + range_to_list(0xB0, 0xB6)),
-                    TileSubBank("Forest 3", [0xA3] + range_to_list(0xB6, 0xBC)),
+                    TileSubBank("Forest 0", _FOREST_TILES[0]),
+                    TileSubBank("Forest 1", _FOREST_TILES[1]),
+                    TileSubBank("Forest 2", _FOREST_TILES[2]),
+                    TileSubBank("Forest 3", _FOREST_TILES[3]),
                 ],
                 self.tiles_per_row,
                 self.tile_scale,
@@ -120,24 +167,34 @@ class TilePicker:
             ),
         ]
 
-        # Spacing between banks (vertical gap)
-        self.bank_spacing = 8
-
-        # Cached bank positions (y-offset for each bank)
-        self._bank_positions = []
-        self._calculate_bank_positions()
-
-        # Track tile currently under mouse
-        self.hovered_tile = None
-
     def _calculate_bank_positions(self):
-        """Calculate y-offset for each bank (for layout and hit testing)."""
+        """Calculate y-offset for each bank (for layout and hit testing) and the scroll limit."""
         self._bank_positions = []
+        self._bank_ends = []
         current_y = 10  # Top margin
 
         for bank in self.banks:
+            bank_end = current_y + bank.get_height()
             self._bank_positions.append(current_y)
-            current_y += bank.get_height() + self.bank_spacing
+            self._bank_ends.append(bank_end)
+            current_y = bank_end + self.bank_spacing
+
+        # Scrolling stops once the last bank is in view
+        self._max_scroll = max(0, current_y - self.rect.height)
+
+    def _build_tile_index(self):
+        """Map each tile value to its first position in the bank hierarchy."""
+        self._tile_index = {}
+        for bank_idx, bank in enumerate(self.banks):
+            if isinstance(bank, GroupedTileBank):
+                for subbank_idx, subbank in enumerate(bank.subbanks):
+                    for position, tile_value in enumerate(subbank.tile_indices):
+                        self._tile_index.setdefault(
+                            tile_value, (bank_idx, subbank_idx, position)
+                        )
+            else:
+                for position, tile_value in enumerate(bank.tile_indices):
+                    self._tile_index.setdefault(tile_value, (bank_idx, position))
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle input events. Returns True if handled."""
@@ -145,6 +202,8 @@ class TilePicker:
             # Update hovered tile (doesn't consume event)
             if self.rect.collidepoint(event.pos):
                 new_hover = self._tile_at_position(event.pos)
+            elif self.hovered_tile is None:
+                return False  # Still outside the picker, nothing to update
             else:
                 new_hover = None
 
@@ -155,8 +214,9 @@ class TilePicker:
                     self.on_hover_change(new_hover)
             # Don't return True - let event propagate to buttons
 
-        if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
-            shift_held = pygame.key.get_mods() & pygame.KMOD_SHIFT
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in _SHIFT_KEYS:
+            # The event carries the modifier state after this key, no need to poll SDL
+            shift_held = event.mod & pygame.KMOD_SHIFT
             if not shift_held:
                 # if we were holding shift previously
                 if self.shift_held and self.on_hover_change:
@@ -178,7 +238,7 @@ class TilePicker:
                     self.scroll_y = max(0, self.scroll_y - 20)
                     return True
                 elif event.button == 5:  # Scroll down
-                    self.scroll_y += 20
+                    self.scroll_y = min(self._max_scroll, self.scroll_y + 20)
                     return True
         return False
 
@@ -193,120 +253,127 @@ class TilePicker:
 
     def _tile_at_position(self, pos: tuple[int, int]) -> int | None:
         """Get tile index at screen position, or None if invalid."""
-        local_x = pos[0] - self.rect.x - 10
-        local_y = pos[1] - self.rect.y + self.scroll_y
-
-        # Find which bank we're in
-        for bank_idx, bank in enumerate(self.banks):
-            bank_y_start = self._bank_positions[bank_idx]
-            bank_height = bank.get_height()
-            bank_y_end = bank_y_start + bank_height
-
-            if bank_y_start <= local_y < bank_y_end:
-                # We're inside this bank
-                # Check if we're in the bank label area
-                if local_y < bank_y_start + bank.label_height:
-                    return None  # Clicked on bank label
-
-                # Position relative to bank's content area (after label + padding)
-                bank_content_y = local_y - (
-                    bank_y_start + bank.label_height + bank.padding
-                )
-
-                # Delegate to bank's hit detection method
-                tile = bank.get_tile_at_position(
-                    local_x - bank.padding,
-                    bank_content_y,
-                    self.tiles_per_row,
-                    self.tile_scale,
-                    self.tile_spacing,
-                )
-                if tile is not None:
-                    return tile
-
-        return None  # Outside all banks
+        rect = self.rect
+        local_x = pos[0] - rect.x - 10
+        local_y = pos[1] - rect.y + self.scroll_y
+
+        # Bank positions are sorted, so bisect for the last bank starting at or above local_y
+        bank_positions = self._bank_positions
+        bank_idx = bisect_right(bank_positions, local_y) - 1
+        if bank_idx < 0 or local_y >= self._bank_ends[bank_idx]:
+            return None  # Above the first bank or in the gap below one
+
+        bank = self.banks[bank_idx]
+        label_bottom = bank_positions[bank_idx] + bank.label_height
+        padding = bank.padding
+
+        # Check if we're in the bank label area
+        if local_y < label_bottom:
+            return None  # Clicked on bank label
+
+        # Position relative to bank's content area (after label + padding)
+        bank_content_y = local_y - (label_bottom + padding)
+
+        # Delegate to bank's hit detection method
+        return bank.get_tile_at_position(
+            local_x - padding,
+            bank_content_y,
+            self.tiles_per_row,
+            self.tile_scale,
+            self.tile_spacing,
+        )
 
     def get_hovered_tile(self) -> int | None:
         """Get the tile value currently under mouse, or None."""
         return self.hovered_tile
 
-    def find_tile_position(self, tile_value: int) -> tuple[int, int, int] | None:
+    def find_tile_position(self, tile_value: int) -> tuple[int, ...] | None:
         """Find position of tile in bank hierarchy.
 
         Returns:
-            (bank_idx, subbank_idx, position_in_subbank) or None if not found
+            - (bank_idx, subbank_idx, position) for grouped banks
+            - (bank_idx, position) for simple banks
+            - None if not found
         """
-        for bank_idx, bank in enumerate(self.banks):
-            for subbank_idx, subbank in enumerate(bank.subbanks):
-                if tile_value in subbank.tile_indices:
-                    position = subbank.tile_indices.index(tile_value)
-                    return (bank_idx, subbank_idx, position)
-        return None
+        return self._tile_index.get(tile_value)
 
     def get_next_tile_in_subbank(self, tile_value: int) -> int | None:
-        """Get next tile in same sub-bank with circular wrapping.
+        """Get next tile in same bank/subbank with circular wrapping.
 
         Returns:
             Next tile value or None if tile not found in any bank
         """
-        position = self.find_tile_position(tile_value)
-        if not position:
-            return None
-
-        bank_idx, subbank_idx, pos = position
-        subbank = self.banks[bank_idx].subbanks[subbank_idx]
-
-        # Circular wrapping
-        next_pos = (pos + 1) % len(subbank.tile_indices)
-        return subbank.tile_indices[next_pos]
+        return self._advance(tile_value, 1)
 
     def get_previous_tile_in_subbank(self, tile_value: int) -> int | None:
-        """Get previous tile in same sub-bank with circular wrapping.
+        """Get previous tile in same bank/subbank with circular wrapping.
 
         Returns:
             Previous tile value or None if tile not found in any bank
         """
+        return self._advance(tile_value, -1)
+
+    def _advance(self, tile_value: int, delta: int) -> int | None:
+        """Step delta tiles through the tile's bank/subbank, wrapping at the ends.
+
+        Simple banks cycle within the bank; grouped banks cycle within the subbank.
+        """
         position = self.find_tile_position(tile_value)
-        if not position:
+        if position is None:
             return None
 
-        bank_idx, subbank_idx, pos = position
-        subbank = self.banks[bank_idx].subbanks[subbank_idx]
+        bank = self.banks[position[0]]
+        if len(position) == 3:
+            tiles = bank.subbanks[position[1]].tile_indices
+        else:
+            tiles = bank.tile_indices
 
-        # Circular wrapping (negative index works in Python)
-        prev_pos = (pos - 1) % len(subbank.tile_indices)
-        return subbank.tile_indices[prev_pos]
+        # Circular wrapping (negative delta wraps via Python's modulo)
+        return tiles[(position[-1] + delta) % len(tiles)]
 
     def render(self, screen: Surface, palette_idx: int = 1):
         """Render the tile picker with all banks."""
+        composite_key = (self.scroll_y, self.selected_tile, palette_idx)
+        if composite_key != self._composite_key:
+            self._render_banks(self._composite, palette_idx)
+            self._composite_key = composite_key
+
+        screen.blit(self._composite, self.rect)
+
+    def _render_banks(self, surface: Surface, palette_idx: int):
+        """Draw the background and all visible banks onto the composite surface."""
         # Background
-        pygame.draw.rect(screen, COLOR_PICKER_BG, self.rect)
+        surface.fill(COLOR_PICKER_BG)
 
-        # Create clipping rect for scrolling
-        clip_rect = self.rect.copy()
-        clip_rect.y += 5
-        clip_rect.height -= 10
+        clip_rect = self._clip_rect
 
-        # Render each bank
+        # Loop-invariant state, bound to locals once per redraw
+        tileset = self.tileset
+        selected_tile = self.selected_tile
+        hovered_tile = self.hovered_tile
+        bank_x = 10
+        origin_y = -self.scroll_y
         picker_width = self.rect.width - 20  # 10px margin on each side
 
-        for i, bank in enumerate(self.banks):
-            bank_y = self.rect.y + self._bank_positions[i] - self.scroll_y
-            bank_x = self.rect.x + 10
+        # Banks are stacked top to bottom, so the visible ones form a contiguous
+        # run: from the first bank ending at or below the clip top to the last
+        # bank starting at or above the clip bottom
+        first = bisect_left(self._bank_ends, clip_rect.y - origin_y)
+        last = bisect_right(self._bank_positions, clip_rect.bottom - origin_y)
 
-            # Skip banks completely outside visible area (optimization)
-            bank_height = bank.get_height()
-            if bank_y + bank_height < clip_rect.y or bank_y > clip_rect.bottom:
-                continue
+        # Render each visible bank
+        for bank_idx in range(first, last):
+            bank = self.banks[bank_idx]
+            bank_y = origin_y + self._bank_positions[bank_idx]
 
             bank.render(
-                screen,
+                surface,
                 bank_x,
                 bank_y,
                 picker_width,
-                self.tileset,
+                tileset,
                 palette_idx,
-                self.selected_tile,
-                self.hovered_tile,
+                selected_tile,
+                hovered_tile,
                 clip_rect,
             )
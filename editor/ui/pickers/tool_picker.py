@@ -14,12 +14,27 @@ from editor.core.constants import (
     COLOR_PICKER_BG,
     COLOR_TEXT,
 )
+from editor.core.pygame_rendering import display_format
 from editor.resources import get_resource_path
 
 
 class ToolButton:
     """Individual tool button in the picker."""
 
+    __slots__ = (
+        "tool_name",
+        "label",
+        "icon_char",
+        "is_action",
+        "rect",
+        "hovered",
+        "icon_surface",
+        "icon_offset",
+        "label_surface",
+        "label_offset",
+        "label_font",
+    )
+
     def __init__(self, tool_name: str, label: str, icon_char: str, is_action: bool = False):
         self.tool_name = tool_name  # "paint", "transform", "forest_fill"
         self.label = label  # "Paint", "Transform", "Forest Fill"
@@ -27,6 +42,13 @@ class ToolButton:
         self.is_action = is_action  # True for action tools that execute immediately
         self.rect: Rect | None = None  # Set during layout
         self.hovered = False
+        # Rendered text, created on first render and reused every frame after,
+        # with the blit offset that centers it relative to the button center
+        self.icon_surface: Surface | None = None
+        self.icon_offset = (0, 0)
+        self.label_surface: Surface | None = None
+        self.label_offset = (0, 0)
+        self.label_font: pygame.font.Font | None = None  # Font label_surface was rendered with
 
 
 class ToolPicker:
@@ -40,23 +62,61 @@ class ToolPicker:
         self.rect = rect
         self.on_tool_change = on_tool_change
         self.selected_tool = "paint"  # Default
-        self.icon_font = pygame.font.Font(str(get_resource_path('data/fonts/NotoEmoji.ttf')), 36)
+        self._icon_font: pygame.font.Font | None = None  # Loaded on first use by icon_font
         self.buttons: list[ToolButton] = []
+        self.hovered_button: ToolButton | None = None
         self.scroll_y = 0  # Scroll offset for overflow
+        # Buttons are drawn into this surface. It is fully redrawn when the layout
+        # (scroll, font, buttons, size) changes; selection and hover changes only
+        # repaint the buttons involved
+        self._panel = Surface(rect.size)
+        self._panel_key: tuple | None = None
+        self._drawn_selected_tool: str | None = None
+        self._drawn_hovered_button: ToolButton | None = None
+
+        # Pre-composed button backgrounds (fill + border), keyed by button state
+        self._button_backgrounds = self._build_button_backgrounds()
+
+    @property
+    def icon_font(self) -> pygame.font.Font:
+        """Icon font, loaded when the first icon is drawn."""
+        if self._icon_font is None:
+            self._icon_font = pygame.font.Font(
+                str(get_resource_path('data/fonts/NotoEmoji.ttf')), 36
+            )
+        return self._icon_font
 
     def register_tool(self, tool_name: str, label: str, icon: str, is_action: bool = False):
         """Add a tool to the picker."""
         button = ToolButton(tool_name, label, icon, is_action)
+        # Earlier buttons keep their positions, so only the new one needs laying out
+        button.rect = self._button_rect(len(self.buttons))
         self.buttons.append(button)
-        self._calculate_button_positions()
 
     def resize(self, rect: Rect):
         """Update picker rect and recalculate button positions."""
+        width_changed = rect.width != self.rect.width
         self.rect = rect
+        if width_changed:
+            self._button_backgrounds = self._build_button_backgrounds()
         self._calculate_button_positions()
         # Clamp scroll to valid range after resize
         self.scroll_y = min(self.scroll_y, self._get_max_scroll())
 
+    def _build_button_backgrounds(self) -> dict[str, Surface]:
+        """Pre-compose one button background surface per button state."""
+        backgrounds = {}
+        for button_state, color in (
+            ("normal", COLOR_BUTTON),
+            ("hovered", COLOR_BUTTON_HOVER),
+            ("selected", COLOR_BUTTON_ACTIVE),
+        ):
+            surf = Surface((self.rect.width - 10, self.BUTTON_HEIGHT))
+            surf.fill(color)
+            pygame.draw.rect(surf, COLOR_TEXT, surf.get_rect(), 1)  # Border
+            backgrounds[button_state] = display_format(surf)
+        return backgrounds
+
     def _get_content_height(self) -> int:
         """Calculate total height of all buttons."""
         if not self.buttons:
@@ -69,17 +129,34 @@ class ToolPicker:
         visible_height = self.rect.height
         return max(0, content_height - visible_height)
 
+    def _button_rect(self, idx: int) -> Rect:
+        """Screen rect (before scrolling) of the button at an index."""
+        return Rect(
+            self.rect.left + 5,
+            self.rect.top + self.TOP_PADDING + idx * (self.BUTTON_HEIGHT + self.BUTTON_SPACING),
+            self.rect.width - 10,
+            self.BUTTON_HEIGHT,
+        )
+
     def _calculate_button_positions(self):
         """Calculate and update button rect positions."""
-        y_offset = self.rect.top + self.TOP_PADDING
-        for button in self.buttons:
-            button.rect = Rect(
-                self.rect.left + 5,
-                y_offset,
-                self.rect.width - 10,
-                self.BUTTON_HEIGHT,
-            )
-            y_offset += self.BUTTON_HEIGHT + self.BUTTON_SPACING
+        for idx, button in enumerate(self.buttons):
+            button.rect = self._button_rect(idx)
+
+    def _button_at(self, pos: tuple[int, int]) -> ToolButton | None:
+        """Get the button under a screen position inside the picker, or None."""
+        # Buttons are stacked at a fixed stride, so the row gives the only candidate
+        # Compare in unscrolled coordinates rather than building a scrolled rect
+        x = pos[0]
+        y = pos[1] + self.scroll_y
+        stride = self.BUTTON_HEIGHT + self.BUTTON_SPACING
+        idx = (y - self.rect.top - self.TOP_PADDING) // stride
+        if 0 <= idx < len(self.buttons):
+            button = self.buttons[idx]
+            rect = button.rect
+            if rect and rect.left <= x < rect.right and rect.top <= y < rect.bottom:
+                return button
+        return None
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse clicks, hover, and scroll. Returns True if handled."""
@@ -93,79 +170,129 @@ class ToolPicker:
                     self.scroll_y = min(self._get_max_scroll(), self.scroll_y + 30)
                     return True
                 elif event.button == 1:  # Left click
-                    # Check if click is on any button (accounting for scroll)
-                    for button in self.buttons:
-                        if button.rect:
-                            # Create scroll-adjusted rect for hit testing
-                            adjusted_rect = button.rect.move(0, -self.scroll_y)
-                            # Check if visible and clicked
-                            if adjusted_rect.collidepoint(event.pos) and adjusted_rect.bottom > self.rect.top and adjusted_rect.top < self.rect.bottom:
-                                if button.is_action:
-                                    # Action tools: always execute, don't change selection
-                                    self.on_tool_change(button.tool_name)
-                                else:
-                                    # Modal tools: only change if different
-                                    if button.tool_name != self.selected_tool:
-                                        self.selected_tool = button.tool_name
-                                        self.on_tool_change(button.tool_name)
-                                return True
+                    # Check if click is on a button (accounting for scroll)
+                    button = self._button_at(event.pos)
+                    if button:
+                        if button.is_action:
+                            # Action tools: always execute, don't change selection
+                            self.on_tool_change(button.tool_name)
+                        else:
+                            # Modal tools: only change if different
+                            if button.tool_name != self.selected_tool:
+                                self.selected_tool = button.tool_name
+                                self.on_tool_change(button.tool_name)
+                        return True
 
         elif event.type == pygame.MOUSEMOTION:
-            # Update hover states (accounting for scroll)
-            mouse_pos = event.pos
-            for button in self.buttons:
-                if button.rect:
-                    adjusted_rect = button.rect.move(0, -self.scroll_y)
-                    button.hovered = adjusted_rect.collidepoint(mouse_pos) and self.rect.collidepoint(mouse_pos)
+            # Update hover state (accounting for scroll); only the buttons
+            # entering or leaving hover are touched
+            if self.rect.collidepoint(event.pos):
+                hovered = self._button_at(event.pos)
+            else:
+                hovered = None
+
+            if hovered is not self.hovered_button:
+                if self.hovered_button:
+                    self.hovered_button.hovered = False
+                if hovered:
+                    hovered.hovered = True
+                self.hovered_button = hovered
 
         return False
 
     def render(self, screen: Surface, font: pygame.font.Font):
         """Render tool buttons with selection highlight."""
+        # Nothing to draw when the panel is laid out off-screen (e.g. a small window)
+        if not self.rect.colliderect(screen.get_clip()):
+            return
+
+        panel_key = (self.scroll_y, font, len(self.buttons), self.rect.size)
+        if panel_key != self._panel_key:
+            if self._panel.get_size() != self.rect.size:
+                self._panel = Surface(self.rect.size)
+            self._render_buttons(self._panel, font)
+            self._panel_key = panel_key
+        elif (
+            self.selected_tool != self._drawn_selected_tool
+            or self.hovered_button is not self._drawn_hovered_button
+        ):
+            # Repaint only the buttons gaining or losing selection or hover
+            changed_tools = set()
+            if self.selected_tool != self._drawn_selected_tool:
+                changed_tools.update((self._drawn_selected_tool, self.selected_tool))
+            changed_buttons = set()
+            if self.hovered_button is not self._drawn_hovered_button:
+                changed_buttons.update((self._drawn_hovered_button, self.hovered_button))
+            for button in self.buttons:
+                if button.tool_name in changed_tools or button in changed_buttons:
+                    self._draw_button(self._panel, button, font)
+
+        self._drawn_selected_tool = self.selected_tool
+        self._drawn_hovered_button = self.hovered_button
+        screen.blit(self._panel, self.rect)
+
+    def _render_buttons(self, surface: Surface, font: pygame.font.Font):
+        """Draw the background and all visible buttons onto the panel surface."""
         # Background
-        pygame.draw.rect(screen, COLOR_PICKER_BG, self.rect)
+        surface.fill(COLOR_PICKER_BG)
 
-        # Set clipping to picker rect to prevent overflow
-        screen.set_clip(self.rect)
+        # Render each visible button
+        buttons = self.buttons
+        for idx in self._visible_button_range():
+            self._draw_button(surface, buttons[idx], font)
 
-        # Render each button
-        for button in self.buttons:
-            if not button.rect:
-                continue
+    def _visible_button_range(self) -> range:
+        """Indices of the buttons at least partly inside the picker at the current scroll."""
+        # Buttons are stacked at a fixed stride, so the visible ones follow from the scroll offset
+        stride = self.BUTTON_HEIGHT + self.BUTTON_SPACING
+        first = max(0, -((self.TOP_PADDING + self.BUTTON_HEIGHT - self.scroll_y) // stride))
+        last = min(
+            len(self.buttons),
+            (self.rect.height + self.scroll_y - self.TOP_PADDING) // stride + 1,
+        )
+        return range(first, max(first, last))
 
-            # Apply scroll offset to button position
-            adjusted_rect = button.rect.move(0, -self.scroll_y)
+    def _draw_button(self, surface: Surface, button: ToolButton, font: pygame.font.Font):
+        """Draw one button onto the panel surface, if it is visible."""
+        if not button.rect:
+            return
 
-            # Skip buttons that are fully outside visible area
-            if adjusted_rect.bottom < self.rect.top or adjusted_rect.top > self.rect.bottom:
-                continue
+        # Button rects are in screen coordinates; shift into the panel and apply scroll
+        adjusted_rect = button.rect.move(-self.rect.left, -self.rect.top - self.scroll_y)
 
-            # Determine button color
-            if button.tool_name == self.selected_tool:
-                color = COLOR_BUTTON_ACTIVE
-            elif button.hovered:
-                color = COLOR_BUTTON_HOVER
-            else:
-                color = COLOR_BUTTON
+        # Skip buttons that are fully outside visible area
+        if adjusted_rect.bottom < 0 or adjusted_rect.top > self.rect.height:
+            return
+
+        # Draw button background and border
+        if button.tool_name == self.selected_tool:
+            background = self._button_backgrounds["selected"]
+        elif button.hovered:
+            background = self._button_backgrounds["hovered"]
+        else:
+            background = self._button_backgrounds["normal"]
+        surface.blit(background, adjusted_rect)
 
-            # Draw button background
-            pygame.draw.rect(screen, color, adjusted_rect)
-            pygame.draw.rect(screen, COLOR_TEXT, adjusted_rect, 1)  # Border
+        center_x, center_y = adjusted_rect.center
 
-            # Render icon (centered, larger font)
-            icon_font = self.icon_font
-            icon_surface = icon_font.render(button.icon_char, True, COLOR_TEXT)
-            icon_rect = icon_surface.get_rect(
-                centerx=adjusted_rect.centerx, centery=adjusted_rect.centery - 10
+        # Render icon (centered, larger font)
+        if button.icon_surface is None:
+            button.icon_surface = display_format(
+                self.icon_font.render(button.icon_char, True, COLOR_TEXT), alpha=True
             )
-            screen.blit(icon_surface, icon_rect)
+            width, height = button.icon_surface.get_size()
+            button.icon_offset = (-(width // 2), -10 - height // 2)
+        offset_x, offset_y = button.icon_offset
+        surface.blit(button.icon_surface, (center_x + offset_x, center_y + offset_y))
 
-            # Render label (centered, below icon)
-            label_surface = font.render(button.label, True, COLOR_TEXT)
-            label_rect = label_surface.get_rect(
-                centerx=adjusted_rect.centerx, centery=adjusted_rect.centery + 15
+        # Render label (centered, below icon)
+        if button.label_font is not font:
+            button.label_surface = display_format(
+                font.render(button.label, True, COLOR_TEXT), alpha=True
             )
-            screen.blit(label_surface, label_rect)
+            button.label_font = font
+            width, height = button.label_surface.get_size()
+            button.label_offset = (-(width // 2), 15 - height // 2)
+        offset_x, offset_y = button.label_offset
+        surface.blit(button.label_surface, (center_x + offset_x, center_y + offset_y))
 
-        # Reset clipping
-        screen.set_clip(None)
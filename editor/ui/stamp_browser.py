@@ -17,6 +17,7 @@ from editor.core.constants import (
     COLOR_SELECTION,
     COLOR_TEXT,
 )
+from editor.core.pygame_rendering import atlas_areas, display_format
 from editor.data import StampData
 from editor.ui.category_tree_view import CategoryTreeView
 
@@ -24,6 +25,9 @@ from editor.ui.category_tree_view import CategoryTreeView
 class StampBrowser:
     """Stamp browser widget for selecting stamps from library."""
 
+    # Max rendered stamp previews kept by _get_stamp_preview
+    PREVIEW_CACHE_SIZE = 256
+
     def __init__(
         self,
         rect: Rect,
@@ -60,8 +64,24 @@ class StampBrowser:
         # Hovered stamp
         self.hovered_stamp_id: str | None = None
 
-        # Preview cache for performance
-        self._preview_cache: dict[str, Surface] = {}
+        # List row under the mouse when hover was last resolved; motion within
+        # the same row (or outside the panel) leaves the hover untouched
+        self._hover_key: tuple | None = None
+
+        # Preview LRU cache for performance, keyed by (stamp, palette index);
+        # kept across category switches
+        self._preview_cache: dict[tuple[StampData, int], Surface] = {}
+
+        # Rendered text (stamp names, sizes, messages), keyed by string
+        self._text_cache: dict[str, Surface] = {}
+
+        # Stamp list is drawn into this surface. It is fully redrawn when the
+        # stamps, scroll position, palette or size change; selection and hover
+        # changes only repaint the items involved
+        self._list_surface = Surface((0, 0))
+        self._list_key: tuple | None = None
+        self._drawn_selected_id: str | None = None
+        self._drawn_hovered_id: str | None = None
 
         # Layout constants
         self.tree_height = 200  # Height of category tree view
@@ -70,20 +90,53 @@ class StampBrowser:
         self.item_padding = 5
         self.margin = 10
 
+        # Pre-composed item backgrounds (fill + border), keyed by item state
+        self._item_backgrounds = self._build_item_backgrounds()
+
+        # Preview box, moved into place for each item drawn
+        self._preview_rect = Rect(5, 0, self.preview_box_size, self.preview_box_size)
+
+        # Calculate layout
+        self._calculate_layout()
+
         # Create category tree view
-        tree_rect = Rect(
-            rect.x + 10,
-            rect.y + 10,
-            rect.width - 20,
-            self.tree_height,
-        )
         self.category_tree_view = CategoryTreeView(
-            tree_rect,
+            self._tree_rect,
             stamp_library.category_tree,
             font,
             on_category_selected=self._on_category_selected,
         )
 
+    def _calculate_layout(self):
+        """Calculate the category tree and stamp list rectangles."""
+        self._tree_rect = Rect(
+            self.rect.x + 10,
+            self.rect.y + 10,
+            self.rect.width - 20,
+            self.tree_height,
+        )
+        # Stamp list fills the panel below the tree view
+        self._list_rect = Rect(
+            self.rect.x + 10,
+            self._tree_rect.bottom + 10,
+            self.rect.width - 20,
+            max(0, self.rect.height - (10 + self.tree_height + 20)),
+        )
+
+    def _build_item_backgrounds(self) -> dict[str, Surface]:
+        """Pre-compose one stamp item background surface per item state."""
+        backgrounds = {}
+        for item_state, color, border_color, border_width in (
+            ("normal", COLOR_BUTTON, COLOR_GRID, 1),
+            ("hovered", COLOR_BUTTON_HOVER, COLOR_GRID, 1),
+            ("selected", COLOR_BUTTON_ACTIVE, COLOR_SELECTION, 2),
+        ):
+            surf = Surface((self.rect.width - 20, self.item_height))
+            surf.fill(color)
+            pygame.draw.rect(surf, border_color, surf.get_rect(), border_width)
+            backgrounds[item_state] = display_format(surf)
+        return backgrounds
+
     def _on_category_selected(self, category_path: str):
         """Callback when category is selected in tree."""
         self.current_category = category_path
@@ -98,10 +151,17 @@ class StampBrowser:
         # Then handle stamp list events
         if event.type == pygame.MOUSEMOTION:
             if self.rect.collidepoint(event.pos):
-                new_hover = self._stamp_at_position(event.pos)
-                if new_hover != self.hovered_stamp_id:
-                    self.hovered_stamp_id = new_hover
+                hover_key = (
+                    self.current_category,
+                    self.scroll_y,
+                    self.stamp_library.get_stamp_count(),
+                    self._row_at_position(event.pos),
+                )
+                if hover_key != self._hover_key:
+                    self._hover_key = hover_key
+                    self.hovered_stamp_id = self._stamp_at_position(event.pos)
             else:
+                self._hover_key = None
                 self.hovered_stamp_id = None
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -124,57 +184,44 @@ class StampBrowser:
 
         return False
 
-    def _stamp_at_position(self, pos: tuple[int, int]) -> str | None:
-        """Get stamp ID at screen position, or None if invalid."""
+    def _row_at_position(self, pos: tuple[int, int]) -> int | None:
+        """Get the stamp list row at screen position, or None if above the list or in a gap."""
         # Check if position is in stamp list area (below tree view)
-        list_y_start = self.rect.y + 10 + self.tree_height + 10
+        list_y_start = self._list_rect.y
         if pos[1] < list_y_start:
             return None
 
         local_y = pos[1] - list_y_start + self.scroll_y
 
+        # Items are stacked at a fixed stride, so the row gives the only candidate
+        stride = self.item_height + self.item_padding
+        if local_y % stride >= self.item_height:
+            return None
+        return local_y // stride
+
+    def _stamp_at_position(self, pos: tuple[int, int]) -> str | None:
+        """Get stamp ID at screen position, or None if invalid."""
+        row = self._row_at_position(pos)
+        if row is None:
+            return None
+
         # Get stamps for current category path
         if not self.current_category:
             return None
 
         stamps = self.stamp_library.get_stamps_by_path(self.current_category)
-
-        for i, stamp in enumerate(stamps):
-            item_y_start = i * (self.item_height + self.item_padding)
-            item_y_end = item_y_start + self.item_height
-
-            if item_y_start <= local_y < item_y_end:
-                return stamp.metadata.id
+        if row < len(stamps):
+            return stamps[row].metadata.id
 
         return None
 
-    @staticmethod
-    def _draw_checkered_tile(surface: Surface, x: int, y: int, size: int):
-        """
-        Draw a checkered pattern to indicate transparent tile.
-
-        Args:
-            surface: Pygame surface to draw on
-            x: X position
-            y: Y position
-            size: Tile size
-        """
-        # Checkered pattern colors (gray tones)
-        TRANSPARENT_COLOR1 = (100, 100, 100)
-        TRANSPARENT_COLOR2 = (140, 140, 140)
-
-        checker_size = max(size // 4, 2)
-
-        for row in range(0, size, checker_size):
-            for col in range(0, size, checker_size):
-                # Alternate colors in checkerboard pattern
-                if (row // checker_size + col // checker_size) % 2 == 0:
-                    color = TRANSPARENT_COLOR1
-                else:
-                    color = TRANSPARENT_COLOR2
-
-                rect = pygame.Rect(x + col, y + row, checker_size, checker_size)
-                pygame.draw.rect(surface, color, rect)
+    def _render_text(self, text: str) -> Surface:
+        """Render text in the browser font, reusing the Surface for repeated strings."""
+        surf = self._text_cache.get(text)
+        if surf is None:
+            surf = display_format(self.font.render(text, True, COLOR_TEXT), alpha=True)
+            self._text_cache[text] = surf
+        return surf
 
     def _render_stamp_preview(
         self, screen: Surface, stamp, preview_rect: Rect, palette_idx: int
@@ -188,25 +235,31 @@ class StampBrowser:
             preview_rect: Rectangle for preview (e.g., 48x48)
             palette_idx: Palette index to use for rendering
         """
+        stamp_surf = self._get_stamp_preview(stamp, palette_idx, preview_rect.width)
+
+        # Center stamp in preview box
+        center_x = preview_rect.centerx - stamp_surf.get_width() // 2
+        center_y = preview_rect.centery - stamp_surf.get_height() // 2
+        screen.blit(stamp_surf, (center_x, center_y))
+
+        # Draw border around preview box
+        pygame.draw.rect(screen, COLOR_GRID, preview_rect, 1)
+
+    def _get_stamp_preview(self, stamp: StampData, palette_idx: int, box_size: int) -> Surface:
+        """Get the stamp rendered at the largest whole scale that fits the preview box."""
         from editor.core.constants import TILE_SIZE
 
-        # Create cache key with palette
-        cache_key = f"{stamp.metadata.id}_p{palette_idx}"
-
-        # Check cache first
-        if cache_key in self._preview_cache:
-            cached_surf = self._preview_cache[cache_key]
-            # Center cached preview in preview box
-            center_x = preview_rect.centerx - cached_surf.get_width() // 2
-            center_y = preview_rect.centery - cached_surf.get_height() // 2
-            screen.blit(cached_surf, (center_x, center_y))
-            # Draw border around preview box
-            pygame.draw.rect(screen, COLOR_GRID, preview_rect, 1)
-            return
+        # The library loads a new StampData whenever a stamp changes, so the
+        # object itself identifies the stamp's contents
+        cache_key = (stamp, palette_idx)
+        cached = self._preview_cache.pop(cache_key, None)
+        if cached is not None:
+            self._preview_cache[cache_key] = cached
+            return cached
 
         # Calculate scale to fit preview box
         max_dimension = max(stamp.width, stamp.height)
-        tile_scale = max(1, preview_rect.width // (max_dimension * TILE_SIZE))
+        tile_scale = max(1, box_size // (max_dimension * TILE_SIZE))
 
         # Create temporary surface for stamp
         stamp_width = stamp.width * TILE_SIZE * tile_scale
@@ -214,32 +267,39 @@ class StampBrowser:
         stamp_surf = Surface((stamp_width, stamp_height))
         stamp_surf.fill(COLOR_PICKER_BG)
 
-        # Render each tile
+        # Render each tile, queueing background tiles from the palette's atlas
+        # so they are drawn in one batched call
+        tile_size = TILE_SIZE * tile_scale
+        atlas = self.tileset.get_atlas(palette_idx, tile_scale)
+        areas = atlas_areas(tile_scale)
+        tile_blits = []
         for row in range(stamp.height):
+            tile_y = row * tile_size
             for col in range(stamp.width):
                 tile_value = stamp.get_tile(row, col)
-                tile_size = TILE_SIZE * tile_scale
                 tile_x = col * tile_size
-                tile_y = row * tile_size
 
                 if tile_value is None:
-                    # Transparent tile: draw checkered pattern
-                    self._draw_checkered_tile(stamp_surf, tile_x, tile_y, tile_size)
+                    # Transparent tile: the atlas placeholder slot holds the
+                    # pre-rendered gray checkered pattern
+                    tile_blits.append((atlas, (tile_x, tile_y), areas[0x100]))
+                elif tile_value < 0x100:
+                    # Regular tile: copy from the atlas for the selected palette
+                    tile_blits.append((atlas, (tile_x, tile_y), areas[tile_value]))
                 else:
-                    # Regular tile: render with selected palette
+                    # Outside the atlas: render with selected palette
                     tile_surf = self.tileset.render_tile(tile_value, palette_idx, tile_scale)
                     stamp_surf.blit(tile_surf, (tile_x, tile_y))
 
+        stamp_surf.blits(tile_blits, doreturn=False)
+        stamp_surf = display_format(stamp_surf)
+
         # Cache the preview with palette
+        if len(self._preview_cache) >= self.PREVIEW_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is least recently used
+            del self._preview_cache[next(iter(self._preview_cache))]
         self._preview_cache[cache_key] = stamp_surf
-
-        # Center stamp in preview box
-        center_x = preview_rect.centerx - stamp_surf.get_width() // 2
-        center_y = preview_rect.centery - stamp_surf.get_height() // 2
-        screen.blit(stamp_surf, (center_x, center_y))
-
-        # Draw border around preview box
-        pygame.draw.rect(screen, COLOR_GRID, preview_rect, 1)
+        return stamp_surf
 
     def render(self, screen: Surface, palette_idx: int = 0):
         """
@@ -249,25 +309,23 @@ class StampBrowser:
             screen: Pygame surface
             palette_idx: Palette index to use for stamp previews (default: 0)
         """
+        # Nothing to draw when the panel is laid out off-screen (e.g. a small window)
+        if not self.rect.colliderect(screen.get_clip()):
+            return
+
         # Background
-        pygame.draw.rect(screen, COLOR_PICKER_BG, self.rect)
+        screen.fill(COLOR_PICKER_BG, self.rect)
 
         # Render category tree view
         self.category_tree_view.render(screen)
 
-        # Create clipping rect for stamp list (below tree view)
-        list_y_start = self.rect.y + 10 + self.tree_height + 10
-        list_rect = Rect(
-            self.rect.x + 10,
-            list_y_start,
-            self.rect.width - 20,
-            self.rect.height - (10 + self.tree_height + 20),
-        )
+        # Clipping rect for stamp list (below tree view)
+        list_rect = self._list_rect
 
         # Render stamp list
         if not self.current_category:
             # Show "Select a category" message
-            msg_surf = self.font.render("Select a category", True, COLOR_TEXT)
+            msg_surf = self._render_text("Select a category")
             msg_rect = msg_surf.get_rect(center=list_rect.center)
             screen.blit(msg_surf, msg_rect)
             return
@@ -276,80 +334,94 @@ class StampBrowser:
 
         if not stamps:
             # Show "No stamps" message
-            msg_surf = self.font.render("No stamps in this category", True, COLOR_TEXT)
+            msg_surf = self._render_text("No stamps in this category")
             msg_rect = msg_surf.get_rect(center=list_rect.center)
             screen.blit(msg_surf, msg_rect)
-        else:
-            # Render each stamp item
-            for i, stamp in enumerate(stamps):
-                item_y = list_y_start + i * (self.item_height + self.item_padding) - self.scroll_y
-                item_rect = Rect(
-                    list_rect.x,
-                    item_y,
-                    list_rect.width,
-                    self.item_height,
-                )
-
-                # Skip items outside visible area
-                if item_y + self.item_height < list_rect.y or item_y > list_rect.bottom:
-                    continue
+            return
 
-                is_selected = stamp.metadata.id == self.selected_stamp_id
-                is_hovered = stamp.metadata.id == self.hovered_stamp_id
+        # Stamps are reloaded as new objects whenever the library changes,
+        # so the stamp tuple identifies the list contents
+        list_key = (tuple(stamps), self.scroll_y, palette_idx, list_rect.size)
+        if list_key != self._list_key:
+            if self._list_surface.get_size() != list_rect.size:
+                self._list_surface = Surface(list_rect.size)
+            self._render_stamp_list(self._list_surface, stamps, palette_idx)
+            self._list_key = list_key
+        else:
+            # Repaint only the items gaining or losing selection or hover
+            changed_ids = set()
+            if self.selected_stamp_id != self._drawn_selected_id:
+                changed_ids.update((self._drawn_selected_id, self.selected_stamp_id))
+            if self.hovered_stamp_id != self._drawn_hovered_id:
+                changed_ids.update((self._drawn_hovered_id, self.hovered_stamp_id))
+            changed_ids.discard(None)
+            if changed_ids:
+                for i, stamp in enumerate(stamps):
+                    if stamp.metadata.id in changed_ids:
+                        self._draw_stamp_item(self._list_surface, i, stamp, palette_idx)
+
+        self._drawn_selected_id = self.selected_stamp_id
+        self._drawn_hovered_id = self.hovered_stamp_id
+        screen.blit(self._list_surface, list_rect)
+
+    def _render_stamp_list(self, surface: Surface, stamps: list[StampData], palette_idx: int):
+        """Draw the background and all visible stamp items onto the list surface."""
+        surface.fill(COLOR_PICKER_BG)
+
+        # Render each visible stamp item
+        for i in self._visible_item_range(len(stamps), surface.get_height()):
+            self._draw_stamp_item(surface, i, stamps[i], palette_idx)
+
+    def _visible_item_range(self, item_count: int, list_height: int) -> range:
+        """Indices of the stamp items at least partly inside the list at the current scroll."""
+        # Items are stacked at a fixed stride, so the visible ones follow from the scroll offset
+        stride = self.item_height + self.item_padding
+        first = max(0, -((self.item_height - self.scroll_y) // stride))
+        last = min(item_count, (list_height + self.scroll_y) // stride + 1)
+        return range(first, max(first, last))
+
+    def _draw_stamp_item(self, surface: Surface, index: int, stamp: StampData, palette_idx: int):
+        """Draw the stamp item at a list index onto the list surface, if it is visible."""
+        list_height = surface.get_height()
+        item_y = index * (self.item_height + self.item_padding) - self.scroll_y
+
+        # Skip items outside visible area
+        if item_y + self.item_height < 0 or item_y > list_height:
+            return
 
-                # Item background
-                if is_selected:
-                    color = COLOR_BUTTON_ACTIVE
-                elif is_hovered:
-                    color = COLOR_BUTTON_HOVER
-                else:
-                    color = COLOR_BUTTON
+        center_y = item_y + self.item_height // 2
 
-                pygame.draw.rect(screen, color, item_rect)
+        # Item background and border
+        if stamp.metadata.id == self.selected_stamp_id:
+            background = self._item_backgrounds["selected"]
+        elif stamp.metadata.id == self.hovered_stamp_id:
+            background = self._item_backgrounds["hovered"]
+        else:
+            background = self._item_backgrounds["normal"]
+        surface.blit(background, (0, item_y))
 
-                # Item border
-                border_color = COLOR_SELECTION if is_selected else COLOR_GRID
-                border_width = 2 if is_selected else 1
-                pygame.draw.rect(screen, border_color, item_rect, border_width)
+        # Preview box (left side)
+        preview_rect = self._preview_rect
+        preview_rect.y = center_y - self.preview_box_size // 2
+        self._render_stamp_preview(surface, stamp, preview_rect, palette_idx)
 
-                # Preview box (left side)
-                preview_rect = Rect(
-                    item_rect.left + 5,
-                    item_rect.centery - self.preview_box_size // 2,
-                    self.preview_box_size,
-                    self.preview_box_size,
-                )
-                self._render_stamp_preview(screen, stamp, preview_rect, palette_idx)
+        # Text area (right side of preview)
+        text_x_start = preview_rect.right + 10
 
-                # Text area (right side of preview)
-                text_x_start = preview_rect.right + 10
+        # Stamp name/ID, centered 10px above the item's middle
+        name_surf = self._render_text(stamp.get_display_name())
+        surface.blit(name_surf, (text_x_start, center_y - 10 - name_surf.get_height() // 2))
 
-                # Stamp name/ID
-                display_name = stamp.get_display_name()
-                name_surf = self.font.render(display_name, True, COLOR_TEXT)
-                name_rect = name_surf.get_rect(
-                    left=text_x_start,
-                    centery=item_rect.centery - 10,
-                )
-                screen.blit(name_surf, name_rect)
-
-                # Stamp dimensions
-                size_text = f"{stamp.width}×{stamp.height}"
-                size_surf = self.font.render(size_text, True, COLOR_TEXT)
-                size_rect = size_surf.get_rect(
-                    left=text_x_start,
-                    centery=item_rect.centery + 10,
-                )
-                screen.blit(size_surf, size_rect)
+        # Stamp dimensions, centered 10px below the item's middle
+        size_surf = self._render_text(f"{stamp.width}×{stamp.height}")
+        surface.blit(size_surf, (text_x_start, center_y + 10 - size_surf.get_height() // 2))
 
     def resize(self, rect: Rect):
         """Update browser rectangle (e.g., on window resize)."""
+        width_changed = rect.width != self.rect.width
         self.rect = rect
+        if width_changed:
+            self._item_backgrounds = self._build_item_backgrounds()
+        self._calculate_layout()
         # Update category tree view rectangle
-        tree_rect = Rect(
-            rect.x + 10,
-            rect.y + 10,
-            rect.width - 20,
-            self.tree_height,
-        )
-        self.category_tree_view.resize(tree_rect)
+        self.category_tree_view.resize(self._tree_rect)
@@ -40,14 +40,14 @@ class Button:
     def render(self, screen: Surface, font: pygame.font.Font):
         # Use background_color if provided, otherwise use standard button colors
         if self.background_color:
-            pygame.draw.rect(screen, self.background_color, self.rect)
+            screen.fill(self.background_color, self.rect)
         else:
             color = (
                 COLOR_BUTTON_ACTIVE
                 if self.active
                 else (COLOR_BUTTON_HOVER if self.hovered else COLOR_BUTTON)
             )
-            pygame.draw.rect(screen, color, self.rect)
+            screen.fill(color, self.rect)
 
         # Draw selection border (thicker if active)
         border_color = COLOR_SELECTION if self.active else COLOR_GRID
@@ -5,6 +5,7 @@ Unified NES CHR format tile decoding functionality used by all tools.
 This eliminates duplication between the editor, visualizer, and other tools.
 """
 
+import numpy as np
 
 # CHR format constants
 TILE_SIZE = 8  # 8x8 pixels per tile
@@ -32,26 +33,14 @@ def decode_tile(tile_data: bytes, tile_idx: int = 0) -> list[list[int]]:
     if offset + BYTES_PER_TILE > len(tile_data):
         return [[0] * 8 for _ in range(8)]
 
-    # Extract the two bitplanes
-    plane0 = tile_data[offset : offset + 8]  # Low bit plane
-    plane1 = tile_data[offset + 8 : offset + 16]  # High bit plane
-
-    # Decode pixel by pixel
-    pixels = []
-    for row in range(8):
-        row_pixels = []
-        for col in range(8):
-            # Extract bit from each plane (MSB first, left to right)
-            bit_mask = 0x80 >> col
-            low_bit = 1 if (plane0[row] & bit_mask) else 0
-            high_bit = 1 if (plane1[row] & bit_mask) else 0
-
-            # Combine into 2-bit value (0-3)
-            pixel = low_bit | (high_bit << 1)
-            row_pixels.append(pixel)
-        pixels.append(row_pixels)
-
-    return pixels
+    # Unpack both bitplanes (MSB first, left to right) into 2x8x8 bits:
+    # plane 0 holds the low bit, plane 1 the high bit
+    planes = np.unpackbits(
+        np.frombuffer(tile_data, dtype=np.uint8, count=BYTES_PER_TILE, offset=offset)
+    ).reshape(2, 8, 8)
+
+    # Combine into 2-bit values (0-3)
+    return (planes[0] | (planes[1] << 1)).tolist()
 
 
 class TilesetData:
@@ -5,6 +5,8 @@ Provides functions to count tiles that are part of the putting surface area
 on greens. Used by both the analysis CLI tool and the metadata dialog.
 """
 
+import numpy as np
+
 # Tiles that are part of the putting surface
 # (matches PAINTABLE_TILES from editor/tools/carpet_paint_tool.py, excluding placeholder)
 PUTTING_SURFACE_TILES = {
@@ -13,6 +15,9 @@ PUTTING_SURFACE_TILES = {
     *range(0x88, 0xA8),  # Light slopes (0x88-0xA7)
 }
 
+# Sorted tile values, for vectorized counting
+_PUTTING_SURFACE_TILE_VALUES = np.array(sorted(PUTTING_SURFACE_TILES))
+
 
 def count_putting_surface_tiles(greens: list[list[int]]) -> int:
     """
@@ -24,9 +29,6 @@ def count_putting_surface_tiles(greens: list[list[int]]) -> int:
     Returns:
         Number of tiles that are putting surface tiles
     """
-    count = 0
-    for row in greens:
-        for tile in row:
-            if tile in PUTTING_SURFACE_TILES:
-                count += 1
-    return count
+    # Greens may hold tiles past 0xFF (e.g. the 0x100 placeholder), so keep a wide dtype
+    tiles = np.asarray(greens, dtype=np.intp)
+    return int(np.count_nonzero(np.isin(tiles, _PUTTING_SURFACE_TILE_VALUES)))
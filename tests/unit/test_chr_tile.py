@@ -0,0 +1,35 @@
+"""Tests for NES CHR tile decoding."""
+
+from golf.core.chr_tile import BYTES_PER_TILE, decode_tile
+
+
+def test_combines_bitplanes_msb_first():
+    """Plane 0 gives the low bit and plane 1 the high bit, leftmost pixel first."""
+    plane0 = bytes([0b10100000, 0, 0, 0, 0, 0, 0, 0b00000001])
+    plane1 = bytes([0b01100000, 0, 0, 0, 0, 0, 0, 0b00000001])
+
+    pixels = decode_tile(plane0 + plane1)
+
+    assert pixels[0] == [1, 2, 3, 0, 0, 0, 0, 0]
+    assert pixels[7] == [0, 0, 0, 0, 0, 0, 0, 3]
+    assert all(pixels[row] == [0] * 8 for row in range(1, 7))
+
+
+def test_indexes_into_bank():
+    """tile_idx selects the tile at its 16-byte offset in a bank."""
+    bank = bytes(BYTES_PER_TILE) + bytes([0xFF] * 8 + [0x00] * 8)
+
+    assert decode_tile(bank, 1) == [[1] * 8 for _ in range(8)]
+
+
+def test_out_of_range_tile_is_blank():
+    """Tiles past the end of the data decode to color 0."""
+    assert decode_tile(bytes(20), 1) == [[0] * 8 for _ in range(8)]
+
+
+def test_returns_plain_ints():
+    """Pixels are Python ints so they can index palettes directly."""
+    pixels = decode_tile(bytes([0xFF] * BYTES_PER_TILE))
+
+    assert type(pixels[0][0]) is int
+    assert pixels[0][0] == 3
@@ -7,6 +7,7 @@ import pytest
 
 from editor.controllers.editor_state import EditorState, GridMode
 from editor.controllers.event_handler import EventHandler
+from editor.tools.base_tool import ToolResult
 from editor.tools.forest_fill_tool import ForestFillTool
 from editor.tools.paint_tool import PaintTool
 from editor.tools.tool_manager import ToolManager
@@ -262,3 +263,35 @@ class TestEventHandlerDelegation:
         event = MockEvent(pygame.QUIT)
         running = event_handler.handle_events([event])
         assert running is False, "QUIT event should return False to stop application"
+
+
+class TestMotionCoalescing:
+    """Tests for passing runs of motion events to the UI."""
+
+    def test_ui_sees_last_motion_of_run(self, mock_pygame, event_handler):
+        """Pickers get only the last of consecutive motion events; the tool gets all."""
+        active_tool = event_handler.tool_manager.get_active_tool()
+        active_tool.handle_mouse_motion = Mock(return_value=ToolResult())
+        event_handler.terrain_picker.handle_event.return_value = False
+        event_handler.tool_picker.handle_event.return_value = False
+        events = [MockEvent(pygame.MOUSEMOTION, pos=(x, 10)) for x in (1, 2, 3)]
+
+        event_handler.handle_events(events)
+
+        picker_calls = event_handler.terrain_picker.handle_event.call_args_list
+        assert [call.args[0].pos for call in picker_calls] == [(3, 10)]
+        assert event_handler.tool_picker.handle_event.call_count == 1
+        tool_calls = active_tool.handle_mouse_motion.call_args_list
+        assert [call.args[0] for call in tool_calls] == [(1, 10), (2, 10), (3, 10)]
+
+    def test_motion_before_other_events_reaches_ui(self, mock_pygame, event_handler):
+        """Motion followed by a non-motion event is still passed to the pickers."""
+        events = [
+            MockEvent(pygame.MOUSEMOTION, pos=(1, 10)),
+            MockEvent(pygame.MOUSEBUTTONUP, pos=(1, 10), button=1),
+            MockEvent(pygame.MOUSEMOTION, pos=(2, 10)),
+        ]
+
+        event_handler.handle_events(events)
+
+        assert event_handler.terrain_picker.handle_event.call_count == 3
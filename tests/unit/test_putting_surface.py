@@ -0,0 +1,32 @@
+"""Tests for putting surface tile counting."""
+
+from golf.formats.putting_surface import (
+    PUTTING_SURFACE_TILES,
+    count_putting_surface_tiles,
+)
+
+
+def test_counts_only_putting_surface_tiles():
+    """Flat and slope tiles count; fringe and rough do not."""
+    greens = [
+        [0xB0, 0x30, 0x47, 0x88],
+        [0xA7, 0x48, 0x00, 0xFF],
+    ]
+    assert count_putting_surface_tiles(greens) == 5
+
+
+def test_placeholder_tile_not_counted():
+    """The editor's 0x100 placeholder tile is accepted but is not putting surface."""
+    assert count_putting_surface_tiles([[0xB0, 0x100]]) == 1
+
+
+def test_empty_greens():
+    """An empty grid has no putting surface."""
+    assert count_putting_surface_tiles([]) == 0
+
+
+def test_matches_set_membership_on_real_hole(hole_01_data):
+    """Count agrees with a straightforward set-membership scan."""
+    greens = hole_01_data.greens
+    expected = sum(tile in PUTTING_SURFACE_TILES for row in greens for tile in row)
+    assert count_putting_surface_tiles(greens) == expected
@@ -0,0 +1,259 @@
+"""Unit tests for StampBrowser."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.core.pygame_rendering import Tileset
+from editor.data import StampData
+from editor.data.category_tree import CategoryTree
+from editor.ui.stamp_browser import StampBrowser
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+
+def _make_stamp(stamp_id: str, width: int, height: int) -> StampData:
+    stamp = StampData()
+    stamp.width = width
+    stamp.height = height
+    stamp.tiles = [
+        [None if (row + col) % 2 else 0x25 for col in range(width)] for row in range(height)
+    ]
+    stamp.metadata.id = stamp_id
+    return stamp
+
+
+@pytest.fixture
+def stamps():
+    """Stamps shown in the browser's only category."""
+    return [_make_stamp(f"stamp_{i}", i + 1, 2) for i in range(6)]
+
+
+@pytest.fixture
+def display(monkeypatch):
+    """Open a hidden display so tile surfaces can be converted."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+@pytest.fixture
+def stamp_browser(stamps, display):
+    """Create a browser over a stub library with one category of stamps."""
+    pygame.font.init()
+    library = Mock()
+    library.category_tree = CategoryTree()
+    library.get_stamps_by_path.side_effect = lambda path: stamps if path == "terrain" else []
+    library.get_stamp_count.side_effect = lambda: len(stamps)
+    library.get_stamp.side_effect = lambda stamp_id: next(
+        (stamp for stamp in stamps if stamp.metadata.id == stamp_id), None
+    )
+    browser = StampBrowser(
+        Rect(0, 40, 220, 500),
+        library,
+        pygame.font.Font(None, 20),
+        Tileset(str(DATA_DIR / "chr-ram.bin")),
+    )
+    browser.current_category = "terrain"
+    return browser
+
+
+class TestListCaching:
+    """Tests for redrawing the stamp list only when its contents change."""
+
+    @pytest.fixture
+    def redraws(self, stamp_browser, monkeypatch):
+        """Record stamp list redraws instead of drawing items."""
+        calls = []
+        monkeypatch.setattr(
+            stamp_browser,
+            "_render_stamp_list",
+            lambda surface, stamps, palette_idx: calls.append(palette_idx),
+        )
+        return calls
+
+    def test_unchanged_list_is_not_redrawn(self, stamp_browser, redraws):
+        """Repeated renders with no state change reuse the list surface."""
+        screen = pygame.Surface((400, 600))
+        for _ in range(3):
+            stamp_browser.render(screen, 1)
+
+        assert redraws == [1]
+
+    def test_content_changes_trigger_redraw(self, stamp_browser, stamps, redraws):
+        """Scrolling, switching palette or new stamps redraw the whole list."""
+        screen = pygame.Surface((400, 600))
+        stamp_browser.render(screen, 1)
+        stamp_browser.scroll_y = 20
+        stamp_browser.render(screen, 1)
+        stamp_browser.render(screen, 2)
+        stamps[0] = _make_stamp("stamp_0", 3, 3)
+        stamp_browser.render(screen, 2)
+
+        assert redraws == [1, 1, 2, 2]
+
+    def test_hover_and_selection_repaint_only_changed_items(self, stamp_browser, monkeypatch):
+        """Hover and selection changes repaint just the items gaining or losing them."""
+        screen = pygame.Surface((400, 600))
+        repainted = []
+        monkeypatch.setattr(
+            stamp_browser,
+            "_draw_stamp_item",
+            lambda surface, index, stamp, palette_idx: repainted.append(index),
+        )
+        stamp_browser.render(screen, 1)
+        assert repainted == [0, 1, 2, 3]  # Only the items inside the list area
+
+        repainted.clear()
+        stamp_browser.hovered_stamp_id = "stamp_1"
+        stamp_browser.render(screen, 1)
+        assert repainted == [1]
+
+        repainted.clear()
+        stamp_browser.selected_stamp_id = "stamp_3"
+        stamp_browser.hovered_stamp_id = None
+        stamp_browser.render(screen, 1)
+        assert repainted == [1, 3]
+
+
+class TestPreviewCache:
+    """Tests for caching rendered stamp previews."""
+
+    @staticmethod
+    def _transparent_stamp(stamp_id: str, size: int) -> StampData:
+        stamp = _make_stamp(stamp_id, size, size)
+        stamp.tiles = [[None] * size for _ in range(size)]
+        return stamp
+
+    def test_preview_reused_per_stamp_and_palette(self, stamp_browser):
+        """The same stamp and palette reuse one preview; another palette gets its own."""
+        stamp = self._transparent_stamp("clear", 2)
+
+        first = stamp_browser._get_stamp_preview(stamp, 1, 48)
+
+        assert stamp_browser._get_stamp_preview(stamp, 1, 48) is first
+        assert stamp_browser._get_stamp_preview(stamp, 2, 48) is not first
+
+    def test_reloaded_stamp_gets_new_preview(self, stamp_browser):
+        """A stamp reloaded under the same id is not shown with the old preview."""
+        old = stamp_browser._get_stamp_preview(self._transparent_stamp("clear", 2), 1, 48)
+        new = stamp_browser._get_stamp_preview(self._transparent_stamp("clear", 5), 1, 48)
+
+        assert new is not old
+        assert new.get_size() != old.get_size()
+
+    def test_least_recently_used_preview_evicted(self, stamp_browser, monkeypatch):
+        """A full cache drops the preview that has gone longest without use."""
+        monkeypatch.setattr(StampBrowser, "PREVIEW_CACHE_SIZE", 2)
+        first, second, third = (self._transparent_stamp(f"s{i}", 1) for i in range(3))
+
+        first_preview = stamp_browser._get_stamp_preview(first, 1, 48)
+        stamp_browser._get_stamp_preview(second, 1, 48)
+        stamp_browser._get_stamp_preview(first, 1, 48)
+        stamp_browser._get_stamp_preview(third, 1, 48)
+
+        assert len(stamp_browser._preview_cache) == 2
+        assert (second, 1) not in stamp_browser._preview_cache
+        assert stamp_browser._get_stamp_preview(first, 1, 48) is first_preview
+
+    def test_preview_in_display_format(self, stamp_browser):
+        """Cached previews share the display's pixel format."""
+        preview = stamp_browser._get_stamp_preview(_make_stamp("mixed", 2, 2), 1, 48)
+        display = pygame.display.get_surface()
+
+        assert preview.get_bitsize() == display.get_bitsize()
+        assert preview.get_masks() == display.get_masks()
+
+    def test_preview_matches_tiles(self, stamp_browser):
+        """Preview tiles match the tileset's rendering, with checkers for transparency."""
+        stamp = _make_stamp("mixed", 2, 2)
+        preview = stamp_browser._get_stamp_preview(stamp, 1, 48)
+        tile = stamp_browser.tileset.render_tile(0x25, 1, 3)
+        tile_size = tile.get_width()
+
+        for row in range(2):
+            for col in range(2):
+                area = preview.subsurface((col * tile_size, row * tile_size, tile_size, tile_size))
+                if stamp.get_tile(row, col) is None:
+                    assert area.get_at((0, 0))[:3] == (100, 100, 100)
+                else:
+                    assert pygame.image.tobytes(area, "RGB") == pygame.image.tobytes(tile, "RGB")
+
+
+class TestHitTesting:
+    """Tests for mapping screen positions to stamps."""
+
+    def test_items_and_gaps(self, stamp_browser):
+        """Positions inside an item hit it; the padding between items hits nothing."""
+        stamp_browser.scroll_y = 30
+        list_y_start = stamp_browser.rect.y + 10 + stamp_browser.tree_height + 10
+        stride = stamp_browser.item_height + stamp_browser.item_padding
+        item_2_top = list_y_start + 2 * stride - stamp_browser.scroll_y
+
+        assert stamp_browser._stamp_at_position((50, item_2_top)) == "stamp_2"
+        assert stamp_browser._stamp_at_position((50, item_2_top - 1)) is None
+        assert stamp_browser._stamp_at_position((50, list_y_start)) == "stamp_0"
+        assert stamp_browser._stamp_at_position((50, list_y_start - 1)) is None
+
+    def test_past_last_item(self, stamp_browser):
+        """Positions below the last item hit nothing."""
+        list_y_start = stamp_browser.rect.y + 10 + stamp_browser.tree_height + 10
+        stride = stamp_browser.item_height + stamp_browser.item_padding
+
+        assert stamp_browser._stamp_at_position((50, list_y_start + 6 * stride)) is None
+
+    def test_hits_follow_resize(self, stamp_browser):
+        """After a resize, hit testing uses the moved stamp list."""
+        stamp_browser.resize(Rect(0, 100, 220, 500))
+        list_y_start = 100 + 10 + stamp_browser.tree_height + 10
+
+        assert stamp_browser._stamp_at_position((50, list_y_start)) == "stamp_0"
+        assert stamp_browser._stamp_at_position((50, list_y_start - 1)) is None
+
+
+class TestHover:
+    """Tests for tracking the stamp under the mouse."""
+
+    @staticmethod
+    def _motion(pos: tuple[int, int]) -> pygame.event.Event:
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+    def test_motion_within_row_skips_lookup(self, stamp_browser):
+        """Moving inside the hovered item does not look the stamps up again."""
+        list_y_start = stamp_browser.rect.y + 10 + stamp_browser.tree_height + 10
+        library = stamp_browser.stamp_library
+
+        stamp_browser.handle_event(self._motion((50, list_y_start + 5)))
+        assert stamp_browser.hovered_stamp_id == "stamp_0"
+        lookups = library.get_stamps_by_path.call_count
+
+        stamp_browser.handle_event(self._motion((80, list_y_start + 40)))
+        assert stamp_browser.hovered_stamp_id == "stamp_0"
+        assert library.get_stamps_by_path.call_count == lookups
+
+        stride = stamp_browser.item_height + stamp_browser.item_padding
+        stamp_browser.handle_event(self._motion((80, list_y_start + stride)))
+        assert stamp_browser.hovered_stamp_id == "stamp_1"
+
+    def test_leaving_panel_clears_hover(self, stamp_browser):
+        """Moving outside the panel clears the hovered stamp."""
+        list_y_start = stamp_browser.rect.y + 10 + stamp_browser.tree_height + 10
+        stamp_browser.handle_event(self._motion((50, list_y_start + 5)))
+
+        stamp_browser.handle_event(self._motion((stamp_browser.rect.right + 5, list_y_start + 5)))
+        assert stamp_browser.hovered_stamp_id is None
+
+    def test_scrolling_rehits_same_position(self, stamp_browser):
+        """After scrolling, the same mouse position resolves to the new item."""
+        list_y_start = stamp_browser.rect.y + 10 + stamp_browser.tree_height + 10
+        stride = stamp_browser.item_height + stamp_browser.item_padding
+        stamp_browser.handle_event(self._motion((50, list_y_start + 5)))
+
+        stamp_browser.scroll_y = stride
+        stamp_browser.handle_event(self._motion((50, list_y_start + 5)))
+        assert stamp_browser.hovered_stamp_id == "stamp_1"
@@ -0,0 +1,53 @@
+"""Unit tests for tile bank layout helpers."""
+
+from editor.ui.pickers.tile_banks import (
+    GroupedTileBank,
+    TileSubBank,
+    tile_offsets,
+)
+
+
+class TestTileOffsets:
+    """Tests for per-tile grid offsets."""
+
+    def test_offsets_follow_row_major_layout(self):
+        """Offsets step across each row, then down to the next."""
+        assert tile_offsets(5, 2, 10) == ((0, 0), (10, 0), (0, 10), (10, 10), (0, 20))
+
+    def test_offsets_are_shared(self):
+        """Identical layouts reuse the same table."""
+        assert tile_offsets(7, 3, 34) is tile_offsets(7, 3, 34)
+
+
+class TestGroupedTileBankHitTesting:
+    """Tests for locating tiles inside grouped banks."""
+
+    # Two tiles per row, 8px tiles at scale 1 with 2px spacing -> 10px pitch.
+    # Each subbank has 4px spacing and a 14px label above its tiles.
+
+    def _bank(self):
+        return GroupedTileBank(
+            "Test",
+            [TileSubBank("A", [1, 2, 3]), TileSubBank("B", [4, 5])],
+            tiles_per_row=2,
+            tile_scale=1,
+        )
+
+    def test_tiles_in_each_subbank(self):
+        """Positions resolve to tiles in the subbank under them."""
+        bank = self._bank()
+
+        assert bank.get_tile_at_position(0, 18, 2, 1, 2) == 1
+        assert bank.get_tile_at_position(10, 18, 2, 1, 2) == 2
+        assert bank.get_tile_at_position(0, 28, 2, 1, 2) == 3
+        assert bank.get_tile_at_position(10, 56, 2, 1, 2) == 5
+
+    def test_labels_and_gaps_hit_nothing(self):
+        """Subbank labels, empty grid cells and out-of-range rows are misses."""
+        bank = self._bank()
+
+        assert bank.get_tile_at_position(0, 5, 2, 1, 2) is None  # Label A
+        assert bank.get_tile_at_position(10, 28, 2, 1, 2) is None  # Empty cell
+        assert bank.get_tile_at_position(0, 45, 2, 1, 2) is None  # Label B
+        assert bank.get_tile_at_position(0, -1, 2, 1, 2) is None
+        assert bank.get_tile_at_position(0, 66, 2, 1, 2) is None
@@ -0,0 +1,204 @@
+"""Unit tests for TilePicker and GreensTilePicker."""
+
+from pathlib import Path
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.core.pygame_rendering import Tileset
+from editor.ui.pickers.greens_tile_picker import GreensTilePicker
+from editor.ui.pickers.tile_banks import GroupedTileBank
+from editor.ui.pickers.tile_picker import TilePicker
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+
+@pytest.fixture
+def terrain_picker():
+    """Create a terrain picker with a short viewport so it can scroll."""
+    return TilePicker(Tileset(str(DATA_DIR / "chr-ram.bin")), Rect(0, 40, 200, 300))
+
+
+@pytest.fixture
+def greens_picker():
+    """Create a greens picker with a short viewport so it can scroll."""
+    return GreensTilePicker(Tileset(str(DATA_DIR / "green-ram.bin")), Rect(0, 40, 200, 300))
+
+
+def _wheel(button: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(100, 100))
+
+
+class TestScrolling:
+    """Tests for scroll-wheel handling."""
+
+    @pytest.mark.parametrize("picker_name", ["terrain_picker", "greens_picker"])
+    def test_scroll_down_stops_at_content_end(self, picker_name, request):
+        """Scrolling down past the last bank clamps to the maximum scroll."""
+        picker = request.getfixturevalue(picker_name)
+        for _ in range(500):
+            picker.handle_event(_wheel(5))
+
+        assert picker.scroll_y == picker._max_scroll
+        assert 0 < picker.scroll_y < 500 * 20
+
+    def test_scroll_up_stops_at_top(self, terrain_picker):
+        """Scrolling up never goes above the first bank."""
+        terrain_picker.handle_event(_wheel(5))
+        for _ in range(5):
+            terrain_picker.handle_event(_wheel(4))
+
+        assert terrain_picker.scroll_y == 0
+
+    def test_no_scroll_when_content_fits(self):
+        """A viewport taller than the content cannot scroll."""
+        picker = GreensTilePicker(Tileset(str(DATA_DIR / "green-ram.bin")), Rect(0, 40, 200, 5000))
+        picker.handle_event(_wheel(5))
+
+        assert picker.scroll_y == 0
+
+
+class TestTileLookup:
+    """Tests for locating tiles in the bank hierarchy."""
+
+    def test_find_grouped_tile(self, terrain_picker):
+        """Tiles in grouped banks resolve to (bank, subbank, position)."""
+        bank_idx, subbank_idx, position = terrain_picker.find_tile_position(0x100)
+        subbank = terrain_picker.banks[bank_idx].subbanks[subbank_idx]
+
+        assert subbank.tile_indices[position] == 0x100
+
+    def test_find_simple_tile(self, greens_picker):
+        """Tiles in simple greens banks resolve to (bank, position)."""
+        position = greens_picker.find_tile_position(0xB0)
+
+        assert position is not None
+        assert len(position) == 2
+        assert greens_picker.banks[position[0]].tile_indices[position[1]] == 0xB0
+
+    def test_find_missing_tile(self, terrain_picker):
+        """Tiles absent from every bank are not found."""
+        assert terrain_picker.find_tile_position(0x1FF) is None
+        assert terrain_picker.get_next_tile_in_subbank(0x1FF) is None
+        assert terrain_picker.get_previous_tile_in_subbank(0x1FF) is None
+
+    def test_next_and_previous_wrap(self, greens_picker):
+        """Cycling wraps around the ends of a subbank."""
+        bank_idx, subbank_idx, _ = greens_picker.find_tile_position(0x30)
+        tiles = greens_picker.banks[bank_idx].subbanks[subbank_idx].tile_indices
+
+        assert greens_picker.get_previous_tile_in_subbank(tiles[0]) == tiles[-1]
+        assert greens_picker.get_next_tile_in_subbank(tiles[-1]) == tiles[0]
+
+
+class TestHitTesting:
+    """Tests for mapping screen positions to tiles."""
+
+    def test_bank_label_and_gap_miss(self, terrain_picker):
+        """Positions on a bank label or between banks hit no tile."""
+        picker = terrain_picker
+        label_y = picker.rect.y + picker._bank_positions[1] + 2
+        gap_y = picker.rect.y + picker._bank_ends[0]
+
+        assert picker._tile_at_position((picker.rect.x + 20, label_y)) is None
+        assert picker._tile_at_position((picker.rect.x + 20, gap_y)) is None
+
+    def test_first_tile_of_each_simple_bank(self, greens_picker):
+        """The top-left content pixel of every simple bank hits its first tile."""
+        picker = greens_picker
+        simple_banks = [
+            (bank, bank_y)
+            for bank, bank_y in zip(picker.banks, picker._bank_positions, strict=True)
+            if not isinstance(bank, GroupedTileBank)
+        ]
+        assert simple_banks
+
+        for bank, bank_y in simple_banks:
+            x = picker.rect.x + 10 + bank.padding
+            y = picker.rect.y + bank_y + bank.label_height + bank.padding
+
+            assert picker._tile_at_position((x, y)) == bank.tile_indices[0]
+
+
+class TestHover:
+    """Tests for hover tracking on mouse motion."""
+
+    @staticmethod
+    def _motion(pos: tuple[int, int]) -> pygame.event.Event:
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=pos)
+
+    def test_leaving_picker_clears_hover(self, terrain_picker):
+        """Moving off the picker clears the hovered tile and notifies once."""
+        notified = []
+        terrain_picker.on_hover_change = notified.append
+        terrain_picker.shift_held = True
+        terrain_picker.hovered_tile = 0x27
+
+        for _ in range(3):
+            assert terrain_picker.handle_event(self._motion((500, 500))) is False
+
+        assert terrain_picker.hovered_tile is None
+        assert notified == [None]
+
+
+    def test_shift_reports_hovered_tile(self, terrain_picker):
+        """Pressing Shift reports the hovered tile; releasing it clears the report."""
+        notified = []
+        terrain_picker.on_hover_change = notified.append
+        terrain_picker.hovered_tile = 0x27
+
+        terrain_picker.handle_event(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LSHIFT, mod=pygame.KMOD_LSHIFT)
+        )
+        terrain_picker.handle_event(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=pygame.KMOD_LSHIFT)
+        )
+        terrain_picker.handle_event(
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_LSHIFT, mod=pygame.KMOD_NONE)
+        )
+
+        assert notified == [0x27, None]
+        assert not terrain_picker.shift_held
+
+
+class TestCompositeCaching:
+    """Tests for redrawing the picker only when its contents change."""
+
+    @pytest.fixture
+    def redraws(self, terrain_picker, monkeypatch):
+        """Record composite redraws instead of drawing banks."""
+        calls = []
+        monkeypatch.setattr(
+            terrain_picker, "_render_banks", lambda surface, palette_idx: calls.append(palette_idx)
+        )
+        return calls
+
+    def test_unchanged_picker_is_not_redrawn(self, terrain_picker, redraws):
+        """Repeated renders with no state change reuse the composite."""
+        screen = pygame.Surface((400, 400))
+        for _ in range(3):
+            terrain_picker.render(screen, 1)
+
+        assert redraws == [1]
+
+    def test_state_changes_trigger_redraw(self, terrain_picker, redraws):
+        """Scrolling, selecting or switching palette redraws the composite."""
+        screen = pygame.Surface((400, 400))
+        terrain_picker.render(screen, 1)
+        terrain_picker.scroll_y = 20
+        terrain_picker.render(screen, 1)
+        terrain_picker.selected_tile = 0x27
+        terrain_picker.render(screen, 1)
+        terrain_picker.render(screen, 2)
+
+        assert redraws == [1, 1, 1, 2]
+
+    def test_hover_does_not_trigger_redraw(self, terrain_picker, redraws):
+        """Hover state is not drawn, so it does not invalidate the composite."""
+        screen = pygame.Surface((400, 400))
+        terrain_picker.render(screen, 1)
+        terrain_picker.hovered_tile = 0x27
+        terrain_picker.render(screen, 1)
+
+        assert redraws == [1]
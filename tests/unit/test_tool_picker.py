@@ -0,0 +1,196 @@
+"""Unit tests for ToolPicker."""
+
+from unittest.mock import Mock
+
+import pygame
+import pytest
+from pygame import Rect
+
+from editor.ui.pickers.tool_picker import ToolPicker
+
+
+@pytest.fixture
+def tool_picker():
+    """Create a picker with more tools than fit in its rect."""
+    pygame.font.init()
+    picker = ToolPicker(Rect(600, 40, 120, 200), lambda tool_name: None)
+    for name in ("paint", "transform", "forest_fill", "stamp", "eyedropper"):
+        picker.register_tool(name, name.title(), "?")
+    return picker
+
+
+def _motion(pos: tuple[int, int]) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos)
+
+
+class TestHover:
+    """Tests for hover tracking on mouse motion."""
+
+    def test_hover_follows_pointer(self, tool_picker):
+        """Only the button under the pointer is hovered."""
+        tool_picker.handle_event(_motion(tool_picker.buttons[1].rect.center))
+
+        assert [b.hovered for b in tool_picker.buttons] == [False, True, False, False, False]
+
+    def test_hover_accounts_for_scroll(self, tool_picker):
+        """Scrolled buttons are hit at their on-screen position."""
+        tool_picker.scroll_y = tool_picker.BUTTON_HEIGHT + tool_picker.BUTTON_SPACING
+        tool_picker.handle_event(_motion(tool_picker.buttons[1].rect.center))
+
+        assert tool_picker.hovered_button is tool_picker.buttons[2]
+
+    @pytest.mark.parametrize("pos", [(700, 20), (610, 40 + 10 + 60 + 2), (600, 52)])
+    def test_misses_clear_hover(self, tool_picker, pos):
+        """Leaving the picker, or pointing between or beside buttons, clears hover."""
+        tool_picker.handle_event(_motion(tool_picker.buttons[0].rect.center))
+        tool_picker.handle_event(_motion(pos))
+
+        assert tool_picker.hovered_button is None
+        assert not any(b.hovered for b in tool_picker.buttons)
+
+    def test_buttons_scrolled_out_of_view_are_not_hovered(self, tool_picker):
+        """A button's on-screen rect outside the picker cannot be hovered."""
+        last = tool_picker.buttons[-1]
+        tool_picker.handle_event(_motion(last.rect.center))
+
+        assert last.rect.top > tool_picker.rect.bottom
+        assert tool_picker.hovered_button is None
+
+
+class TestClicks:
+    """Tests for selecting tools by clicking."""
+
+    @staticmethod
+    def _click(pos: tuple[int, int]) -> pygame.event.Event:
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+    def test_click_selects_scrolled_button(self, tool_picker):
+        """Clicks hit the button drawn at that position after scrolling."""
+        changes = []
+        tool_picker.on_tool_change = changes.append
+        tool_picker.scroll_y = tool_picker.BUTTON_HEIGHT + tool_picker.BUTTON_SPACING
+
+        on_screen = tool_picker.buttons[2].rect.move(0, -tool_picker.scroll_y)
+
+        assert tool_picker.handle_event(self._click(on_screen.center))
+        assert tool_picker.selected_tool == "forest_fill"
+        assert changes == ["forest_fill"]
+
+    def test_click_between_buttons_is_ignored(self, tool_picker):
+        """Clicks in the spacing between buttons select nothing."""
+        changes = []
+        tool_picker.on_tool_change = changes.append
+        gap_y = tool_picker.buttons[0].rect.bottom + 1
+
+        assert not tool_picker.handle_event(self._click((650, gap_y)))
+        assert changes == []
+
+
+class TestTextCaching:
+    """Tests for reusing rendered button text across frames."""
+
+    def test_label_rendered_once_per_font(self, tool_picker):
+        """Labels are rendered on the first frame and again only if the font changes."""
+        font = Mock()
+        font.render.return_value = pygame.Surface((10, 10))
+        screen = pygame.Surface((800, 400))
+
+        tool_picker.render(screen, font)
+        tool_picker.render(screen, font)
+        visible_buttons = font.render.call_count
+
+        other_font = Mock()
+        other_font.render.return_value = pygame.Surface((10, 10))
+        tool_picker.render(screen, other_font)
+
+        assert 0 < visible_buttons < len(tool_picker.buttons)
+        assert other_font.render.call_count == visible_buttons
+
+
+class TestPanelCaching:
+    """Tests for redrawing the panel only when its contents change."""
+
+    @pytest.fixture
+    def redraws(self, tool_picker, monkeypatch):
+        """Record panel redraws instead of drawing buttons."""
+        calls = []
+        monkeypatch.setattr(
+            tool_picker, "_render_buttons", lambda surface, font: calls.append(tool_picker.scroll_y)
+        )
+        return calls
+
+    def test_unchanged_picker_is_not_redrawn(self, tool_picker, redraws):
+        """Repeated renders with no state change reuse the panel."""
+        screen = pygame.Surface((800, 400))
+        for _ in range(3):
+            tool_picker.render(screen, None)
+
+        assert len(redraws) == 1
+
+    def test_layout_changes_trigger_redraw(self, tool_picker, redraws):
+        """Scrolling or adding a tool redraws the whole panel."""
+        screen = pygame.Surface((800, 400))
+        tool_picker.render(screen, None)
+        tool_picker.scroll_y = 30
+        tool_picker.render(screen, None)
+        tool_picker.register_tool("measure", "Measure", "?")
+        tool_picker.render(screen, None)
+
+        assert redraws == [0, 30, 30]
+
+    def test_hover_and_selection_repaint_only_changed_buttons(self, tool_picker, monkeypatch):
+        """Hover and selection changes repaint just the buttons gaining or losing them."""
+        screen = pygame.Surface((800, 400))
+        font = pygame.font.Font(None, 20)
+        tool_picker.render(screen, font)
+        repainted = []
+        monkeypatch.setattr(
+            tool_picker, "_draw_button", lambda surface, button, font: repainted.append(button)
+        )
+        buttons = tool_picker.buttons
+
+        tool_picker.handle_event(_motion(buttons[1].rect.center))
+        tool_picker.render(screen, font)
+        assert repainted == [buttons[1]]
+
+        repainted.clear()
+        tool_picker.selected_tool = "forest_fill"
+        tool_picker.handle_event(_motion(buttons[2].rect.center))
+        tool_picker.render(screen, font)
+        assert repainted == [buttons[0], buttons[1], buttons[2]]
+
+
+class TestIconFont:
+    """Tests for loading the icon font."""
+
+    def test_loaded_on_first_draw(self, tool_picker, monkeypatch):
+        """The icon font is not opened until a button icon is drawn, then reused."""
+        font = pygame.font.Font(None, 20)
+        loads = []
+        real_font = pygame.font.Font
+        monkeypatch.setattr(
+            pygame.font, "Font", lambda *args: loads.append(args) or real_font(*args)
+        )
+        assert tool_picker._icon_font is None
+
+        screen = pygame.Surface((800, 400))
+        tool_picker.render(screen, font)
+        tool_picker.scroll_y = 40  # Redraw every visible button
+        tool_picker.render(screen, font)
+
+        assert len(loads) == 1
+
+
+class TestOffscreen:
+    """Tests for pickers laid out outside the screen."""
+
+    def test_offscreen_picker_not_drawn(self, tool_picker, monkeypatch):
+        """A picker outside the screen's clip area skips drawing its buttons."""
+        calls = []
+        monkeypatch.setattr(
+            tool_picker, "_render_buttons", lambda surface, font: calls.append(surface)
+        )
+
+        tool_picker.render(pygame.Surface((400, 600)), Mock())
+
+        assert calls == []